@@ -6,6 +6,7 @@ import asyncio
 import json
 import logging
 import re
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
 from typing import Any, AsyncIterator
 
@@ -33,6 +34,8 @@ _EMPTY_THINKING_INFO = {
     "modes": [],
     "source": "unknown",
 }
+# Keep proxies (nginx, dev servers) from buffering SSE so deltas reach the client as produced.
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
 _PRICE_INTENT_RE = re.compile(r"\b(price|cost|value|worth)\b", re.IGNORECASE)
 _CANONICAL_ITEM_ID_RE = re.compile(r"\bT[1-8](?:_[A-Z0-9]+)+(?:@\d+)?\b", re.IGNORECASE)
 _TIER_ITEM_HINT_RE = re.compile(r"\bT[1-8](?:[.@][0-4])?\b", re.IGNORECASE)
@@ -905,6 +908,38 @@ class ChatApplicationService:
     def __init__(self, tracer: LangfuseTracer | None = None) -> None:
         self._langfuse = tracer or LangfuseTracer()
 
+    def _start_generation(
+        self,
+        *,
+        request: ChatRequest,
+        messages: list[Message],
+        model_parameters: dict[str, Any],
+        mcp_enabled: bool,
+        reasoning_config: dict[str, Any],
+        langfuse_options: dict[str, Any],
+        default_name: str,
+    ) -> AbstractContextManager[Any]:
+        """Open a Langfuse generation for the final LLM call.
+
+        Trace payloads (prompt copy and request metadata) are only built when
+        tracing is enabled; otherwise this is a bare ``nullcontext``.
+        """
+        if not self._langfuse.enabled:
+            return nullcontext(None)
+        trace_metadata = _build_langfuse_request_metadata(
+            request=request,
+            mcp_enabled=mcp_enabled,
+            reasoning_config=reasoning_config,
+            langfuse_options=langfuse_options,
+        )
+        return self._langfuse.start_generation(
+            name=str(langfuse_options.get("generation_name") or default_name),
+            model=request.model,
+            prompt=_messages_to_trace_payload(messages),
+            model_parameters=model_parameters,
+            metadata=trace_metadata,
+        )
+
     async def list_ollama_models(self) -> dict[str, Any]:
         try:
             async with ProviderFactory.create("ollama") as provider:
@@ -1016,21 +1051,14 @@ class ChatApplicationService:
                     # Otherwise make a final response call
                     final_messages = [system_prompt, *messages, *tool_context]
 
-                    trace_metadata = _build_langfuse_request_metadata(
+                    with self._start_generation(
                         request=request,
+                        messages=final_messages,
+                        model_parameters=kwargs,
                         mcp_enabled=mcp_enabled,
                         reasoning_config=reasoning_config,
                         langfuse_options=langfuse_options,
-                    )
-                    generation_name = str(
-                        langfuse_options.get("generation_name") or "chat.completion"
-                    )
-                    with self._langfuse.start_generation(
-                        name=generation_name,
-                        model=request.model,
-                        prompt=_messages_to_trace_payload(final_messages),
-                        model_parameters=kwargs,
-                        metadata=trace_metadata,
+                        default_name="chat.completion",
                     ) as generation:
                         try:
                             response = await provider.chat(final_messages, model=request.model, **kwargs)
@@ -1103,21 +1131,14 @@ class ChatApplicationService:
                             yield _sse({"type": "delta", "text": preamble})
                         final_messages = [system_prompt, *messages, *tool_context]
 
-                        trace_metadata = _build_langfuse_request_metadata(
+                        with self._start_generation(
                             request=request,
+                            messages=final_messages,
+                            model_parameters=kwargs,
                             mcp_enabled=mcp_enabled,
                             reasoning_config=reasoning_config,
                             langfuse_options=langfuse_options,
-                        )
-                        generation_name = str(
-                            langfuse_options.get("generation_name") or "chat.completion.stream"
-                        )
-                        with self._langfuse.start_generation(
-                            name=generation_name,
-                            model=request.model,
-                            prompt=_messages_to_trace_payload(final_messages),
-                            model_parameters=kwargs,
-                            metadata=trace_metadata,
+                            default_name="chat.completion.stream",
                         ) as generation:
                             try:
                                 async for chunk in provider.stream_chat(
@@ -1161,7 +1182,7 @@ class ChatApplicationService:
                 yield _sse({"type": "error", "message": str(exc)})
 
         logger.info("[API] Returning StreamingResponse")
-        return StreamingResponse(stream(), media_type="text/event-stream")
+        return StreamingResponse(stream(), media_type="text/event-stream", headers=_SSE_HEADERS)
 
 
 chat_service = ChatApplicationService()
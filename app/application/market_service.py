@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Iterable
+from typing import Any, Iterable, Sequence
 
 from app.data import MarketService, MarketServiceError
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_LATEST_MARKET_CITIES = [
+DEFAULT_LATEST_MARKET_CITIES: tuple[str, ...] = (
     "Caerleon",
     "Thetford",
     "Bridgewatch",
@@ -18,9 +18,9 @@ DEFAULT_LATEST_MARKET_CITIES = [
     "Lymhurst",
     "Black Market",
     "Brecilien",
-]
+)
 
-DEFAULT_HISTORY_CITIES = [
+DEFAULT_HISTORY_CITIES: tuple[str, ...] = (
     "Caerleon",
     "Bridgewatch",
     "Martlock",
@@ -29,7 +29,7 @@ DEFAULT_HISTORY_CITIES = [
     "Lymhurst",
     "Black Market",
     "Brecilien",
-]
+)
 
 
 class MarketApplicationService:
@@ -52,7 +52,7 @@ class MarketApplicationService:
         self,
         *,
         item: str,
-        cities: list[str],
+        cities: Sequence[str],
         quality: int | None = None,
         force_refresh: bool = False,
         max_age_s: float | None = None,
@@ -84,7 +84,7 @@ class MarketApplicationService:
         self,
         *,
         item: str,
-        cities: list[str] | None = None,
+        cities: Sequence[str] | None = None,
         quality: int | None = None,
         time_scale: str = "hourly",
         start_date: str | None = None,
@@ -116,6 +116,7 @@ class MarketApplicationService:
             start_date=start_date,
             end_date=end_date,
             granularity=granularity,
+            exclude_outliers=True,
         )
 
     def query_local_history_raw(
@@ -300,7 +301,7 @@ class MarketApplicationService:
         self,
         *,
         item_id: str,
-        locations: list[str],
+        locations: Sequence[str],
         quality: int | None,
     ) -> dict[str, Any]:
         try:
@@ -31,6 +31,13 @@ _CONTAINER: AppContainer | None = None
 
 
 def get_container() -> AppContainer:
+    """Return the process-wide container, building it on first use.
+
+    ``app.web.main`` builds it at import time, so per-request calls are a
+    single global read. Routers call this directly rather than through
+    ``Depends``. FastAPI's dependency resolution would cost more per request
+    than this lookup, and tests patch ``get_container`` in each router module.
+    """
     global _CONTAINER
     if _CONTAINER is not None:
         return _CONTAINER
@@ -21,6 +21,11 @@ from typing import Any
 import yaml
 from pydantic import BaseModel, ConfigDict, Field
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 class PromptType(StrEnum):
@@ -117,10 +122,11 @@ class PromptDocument(BaseModel):
         Raises:
             FileNotFoundError: If file doesn't exist
         """
-        if not path.exists():
-            raise FileNotFoundError(f"Prompt file not found: {path}")
+        try:
+            raw_content = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Prompt file not found: {path}") from None
 
-        raw_content = path.read_text(encoding="utf-8")
         meta, content = _parse_frontmatter(raw_content)
 
         # Infer type from filename if not specified
@@ -154,7 +160,86 @@ class PromptDocument(BaseModel):
 
     def __bool__(self) -> bool:
         """Check if document has non-empty content."""
-        return bool(self.content.strip())
+        # isspace() scans in C and stops at the first visible character,
+        # without building a stripped copy of the body.
+        content = self.content
+        return bool(content) and not content.isspace()
+
+
+_FM_KEY_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*):(?:\s+(.*))?")
+_FM_ITEM_RE = re.compile(r"\s*-\s+(.*)")
+_FM_INT_RE = re.compile(r"-?(?:0|[1-9][0-9]*)")
+_FM_WORD_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_./ -]*")
+_FM_BOOLS = {"true": True, "True": True, "TRUE": True, "false": False, "False": False, "FALSE": False}
+_FM_NULLS = {"null", "Null", "NULL", "~"}
+# Plain words YAML 1.1 would resolve to booleans; left to the full parser.
+_FM_YAML11_BOOL_WORDS = {"yes", "no", "on", "off"}
+_FM_UNPARSED = object()
+
+
+def _scan_frontmatter_scalar(value: str) -> Any:
+    """Resolve a simple frontmatter scalar, or return _FM_UNPARSED."""
+    if not value:
+        return None
+    first = value[0]
+    if first in "\"'":
+        if len(value) >= 2 and value[-1] == first and first not in value[1:-1] and "\\" not in value:
+            return value[1:-1]
+        return _FM_UNPARSED
+    if value in _FM_BOOLS:
+        return _FM_BOOLS[value]
+    if value in _FM_NULLS:
+        return None
+    if _FM_INT_RE.fullmatch(value):
+        return int(value)
+    if _FM_WORD_RE.fullmatch(value) and value.lower() not in _FM_YAML11_BOOL_WORDS:
+        return value
+    return _FM_UNPARSED
+
+
+def _scan_frontmatter(text: str) -> dict[str, Any] | None:
+    """Parse the flat ``key: value`` / ``- item`` subset of YAML used by prompt files.
+
+    Returns None when the text uses anything outside that subset, so the
+    caller can hand it to the full YAML parser instead.
+    """
+    data: dict[str, Any] = {}
+    list_key: str | None = None
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if not stripped or stripped[0] == "#":
+            continue
+        if "\t" in line or " #" in line:
+            return None
+
+        key_match = _FM_KEY_RE.fullmatch(line.rstrip())
+        if key_match:
+            key, value = key_match.group(1), key_match.group(2)
+            if not value:
+                # Block list (or null) follows
+                data[key] = None
+                list_key = key
+                continue
+            scalar = _scan_frontmatter_scalar(value)
+            if scalar is _FM_UNPARSED:
+                return None
+            data[key] = scalar
+            list_key = None
+            continue
+
+        item_match = _FM_ITEM_RE.fullmatch(line.rstrip())
+        if item_match and list_key is not None:
+            item = _scan_frontmatter_scalar(item_match.group(1))
+            if item is _FM_UNPARSED:
+                return None
+            items = data[list_key]
+            if items is None:
+                items = data[list_key] = []
+            items.append(item)
+            continue
+
+        return None
+    return data
 
 
 def _parse_frontmatter(content: str) -> tuple[PromptMeta, str]:
@@ -195,7 +280,9 @@ def _parse_frontmatter(content: str) -> tuple[PromptMeta, str]:
     body = "\n".join(lines[end_index + 1 :]).strip()
 
     try:
-        parsed = yaml.safe_load(yaml_content) or {}
+        parsed = _scan_frontmatter(yaml_content)
+        if parsed is None:
+            parsed = yaml.load(yaml_content, Loader=_YamlLoader) or {}
         meta = PromptMeta(**parsed)
     except Exception as exc:
         logger.warning("Failed to parse frontmatter: %s", exc)
@@ -204,21 +291,21 @@ def _parse_frontmatter(content: str) -> tuple[PromptMeta, str]:
     return meta, body
 
 
+_FILENAME_TYPES = {
+    "soul": PromptType.SOUL,
+    "memory": PromptType.MEMORY,
+    "skills": PromptType.SKILLS,
+    "user": PromptType.USER,
+    "config": PromptType.CONFIG,
+}
+_FILENAME_TYPE_RE = re.compile("|".join(_FILENAME_TYPES), re.IGNORECASE)
+
+
 def _infer_type_from_filename(filename: str) -> PromptType | None:
-    """Infer prompt type from filename."""
-    name_lower = filename.lower()
-
-    mappings = {
-        "soul": PromptType.SOUL,
-        "memory": PromptType.MEMORY,
-        "skills": PromptType.SKILLS,
-        "user": PromptType.USER,
-        "config": PromptType.CONFIG,
-    }
-
-    for key, prompt_type in mappings.items():
-        if key in name_lower:
-            return prompt_type
+    """Infer prompt type from filename (the leftmost keyword wins)."""
+    match = _FILENAME_TYPE_RE.search(filename)
+    if match:
+        return _FILENAME_TYPES[match.group().lower()]
 
     # Files in tasks/ directory are task type
     return None
@@ -56,6 +56,9 @@ class AODPClient:
     ) -> list[dict[str, Any]]:
         """Fetch current market prices for an item.
 
+        ``item_id`` may be a comma-separated list; each entry carries its own
+        ``item_id`` so the rows can be split per item.
+
         Returns list of price entries with timestamps for freshness checking:
         - sell_price_min, sell_price_min_date
         - sell_price_max, sell_price_max_date
@@ -50,6 +50,7 @@ class AODPConfig:
     timeout_s: float = float(os.getenv("AODP_TIMEOUT_S", "15"))
     cache_ttl_s: float = float(os.getenv("AODP_CACHE_TTL_S", "60"))
     freshness_ttl_s: float = float(os.getenv("AODP_FRESHNESS_TTL_S", "900"))  # 15 minutes
+    batch_window_s: float = float(os.getenv("AODP_BATCH_WINDOW_MS", "10")) / 1000
 
 
 @dataclass(frozen=True)
@@ -9,7 +9,9 @@ from __future__ import annotations
 
 import json
 import logging
+from bisect import bisect_right
 from dataclasses import dataclass, field
+from itertools import accumulate
 from pathlib import Path
 from typing import Any
 
@@ -41,6 +43,18 @@ class DestinyNode:
     levels: list[FameLevel] = field(default_factory=list)
     total_fame: int = 0
     total_levels: int = 0
+    # Prefix sums over ``levels`` for level-window queries; built once per node.
+    fame_prefix: list[int] = field(init=False, repr=False, compare=False)
+    lp_prefix: list[int] = field(init=False, repr=False, compare=False)
+    level_numbers: list[int] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.fame_prefix = list(accumulate((lvl.fame_required for lvl in self.levels), initial=0))
+        self.lp_prefix = list(accumulate((lvl.lp_cost for lvl in self.levels), initial=0))
+        numbers = [lvl.level for lvl in self.levels]
+        # Windows can only be bisected when level numbers strictly increase.
+        ascending = all(a < b for a, b in zip(numbers, numbers[1:]))
+        self.level_numbers = numbers if ascending else None
 
 
 @dataclass
@@ -76,9 +90,15 @@ class DestinyDatabase:
         self._data_dir = data_dir or GAME_DATA_DIR
         self._templates: dict[str, list[FameLevel]] = {}
         self._nodes: dict[str, DestinyNode] = {}
-        self._node_name_index: dict[str, str] = {}  # lowercase -> node_id
+        self._node_name_index: dict[str, DestinyNode] = {}  # lowercase node_id -> node
+        # Search indexes, built once after loading: (lowercase node_id, node) in
+        # load order, overall and per category.
+        self._search_entries: list[tuple[str, DestinyNode]] = []
+        self._search_entries_by_category: dict[str, list[tuple[str, DestinyNode]]] = {}
         self._ip_scaling: dict[str, IPScalingConfig] = {}
         self._ability_power_progression = AbilityPowerProgressionConfig()
+        # Both tables are read from the game data files rather than hard-coded,
+        # so they follow game patches; lookups are a plain dict get once loaded.
         self._energy_share: dict[str, float] = {}
         self._quality_bonuses: dict[int, int] = {1: 0}  # level 1 = no bonus
         self._base_stats: dict[str, Any] = {}
@@ -92,6 +112,7 @@ class DestinyDatabase:
         self._load_achievements()
         self._load_gamedata()
         self._load_characters()
+        self._build_search_index()
         logger.info(
             "[DestinyDB] Loaded %s nodes, %s IP scaling configs",
             len(self._nodes),
@@ -129,7 +150,14 @@ class DestinyDatabase:
             node = self._parse_node(ta)
             if node:
                 self._nodes[node.node_id] = node
-                self._node_name_index[node.node_id.lower()] = node.node_id
+                self._node_name_index[node.node_id.lower()] = node
+
+    def _build_search_index(self) -> None:
+        self._search_entries = [(node_id.lower(), node) for node_id, node in self._nodes.items()]
+        by_category: dict[str, list[tuple[str, DestinyNode]]] = {}
+        for entry in self._search_entries:
+            by_category.setdefault(entry[1].category, []).append(entry)
+        self._search_entries_by_category = by_category
 
     def _parse_template_levels(self, tmpl: dict[str, Any]) -> list[FameLevel]:
         """Parse base + elite levels from a template."""
@@ -282,12 +310,10 @@ class DestinyDatabase:
     def get_destiny_node(self, node_id: str) -> DestinyNode | None:
         """Look up a destiny board node by ID."""
         self._ensure_loaded()
-        if node_id in self._nodes:
-            return self._nodes[node_id]
-        lowered = node_id.lower()
-        if lowered in self._node_name_index:
-            return self._nodes.get(self._node_name_index[lowered])
-        return None
+        node = self._nodes.get(node_id)
+        if node is None:
+            node = self._node_name_index.get(node_id.lower())
+        return node
 
     def get_fame_to_level(
         self, node_id: str, from_level: int = 0, to_level: int | None = None
@@ -304,9 +330,17 @@ class DestinyDatabase:
         to_level = min(to_level, node.total_levels)
         from_level = max(from_level, 0)
 
-        selected = [lvl for lvl in node.levels if from_level < lvl.level <= to_level]
-        total_fame = sum(lvl.fame_required for lvl in selected)
-        total_lp = sum(lvl.lp_cost for lvl in selected)
+        numbers = node.level_numbers
+        if numbers is not None:
+            start = bisect_right(numbers, from_level)
+            end = max(start, bisect_right(numbers, to_level))
+            selected = node.levels[start:end]
+            total_fame = node.fame_prefix[end] - node.fame_prefix[start]
+            total_lp = node.lp_prefix[end] - node.lp_prefix[start]
+        else:
+            selected = [lvl for lvl in node.levels if from_level < lvl.level <= to_level]
+            total_fame = sum(lvl.fame_required for lvl in selected)
+            total_lp = sum(lvl.lp_cost for lvl in selected)
 
         return {
             "node_id": node.node_id,
@@ -375,10 +409,12 @@ class DestinyDatabase:
         query_lower = query.lower()
         results: list[dict[str, Any]] = []
 
-        for node in self._nodes.values():
-            if category and node.category != category:
-                continue
-            if query and query_lower not in node.node_id.lower():
+        if category:
+            entries = self._search_entries_by_category.get(category, ())
+        else:
+            entries = self._search_entries
+        for node_id_lower, node in entries:
+            if query_lower not in node_id_lower:
                 continue
             results.append({
                 "node_id": node.node_id,
@@ -28,13 +28,12 @@ import tarfile
 import tempfile
 import threading
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Iterable, Literal
 
 import httpx
-from bs4 import BeautifulSoup
 
 from .history_db import HistoryDatabase
 
@@ -69,26 +68,65 @@ CSV_COLUMNS = [
     "item_count"
 ]
 
+# A parenthesised value tuple in an INSERT ... VALUES line
+_SQL_TUPLE_PATTERN = re.compile(r"\(([^()]+)\)")
+# Whole-tuple fast path for the usual AODP row shape: bare ints/NULL and
+# simple quoted strings in the first seven columns. Anything else (escapes,
+# unquoted names, odd spacing of NULL) goes through the generic splitter.
+_SQL_INT_FIELD = r"\s*(-?\d+|NULL)\s*"
+_SQL_STR_FIELD = r"""\s*'([^'"\\]*)'\s*"""
+_AODP_VALUES_PATTERN = re.compile(
+    ",".join((
+        r"[^,'\"]*",
+        _SQL_INT_FIELD,
+        _SQL_INT_FIELD,
+        _SQL_STR_FIELD,
+        _SQL_INT_FIELD,
+        _SQL_INT_FIELD,
+        _SQL_STR_FIELD,
+    ))
+    + r"(?:,.*)?"
+)
+# Quoted literals (possibly unterminated) are consumed whole; bare commas split values
+_SQL_VALUE_TOKEN_PATTERN = re.compile(r"'[^']*(?:'|\Z)|\"[^\"]*(?:\"|\Z)|,")
+
 DOWNLOAD_PROGRESS_START = 15.0
 DOWNLOAD_PROGRESS_END = 45.0
 IMPORT_PROGRESS_START = 45.0
 IMPORT_PROGRESS_END = 90.0
 
 
+_DATETIME_TEXT_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+_DATE_TEXT_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+# One row of an Apache/nginx autoindex page: link, then optional date and size
+_LISTING_ROW_PATTERN = re.compile(
+    r'<a\s[^>]*?href="(?P<href>[^"]*)"[^>]*>.*?</a>'
+    r"[ \t]*(?:(?P<date>\d{2}-\w{3}-\d{4})\s+(?P<time>\d{2}:\d{2}))?"
+    r"[ \t]*(?P<size>\d+)?",
+    re.IGNORECASE,
+)
+_DAILY_DUMP_NAME_PATTERN = re.compile(
+    r"db_backup_\d{4}-\d{2}-\d{2}(?:T\d{2}_\d{2}_\d{2})?\.tgz",
+    re.IGNORECASE,
+)
+_DAILY_DUMP_TS_PATTERN = re.compile(r"db_backup_(\d{4}-\d{2}-\d{2})(?:T(\d{2})_(\d{2})_(\d{2}))?")
+
+
 def _normalize_timestamp_for_compare(timestamp: Any) -> str | None:
     """Normalize timestamp-like values for lexicographic comparison.
 
-    Returns format `YYYY-MM-DD HH:MM:SS` when possible.
+    Returns format `YYYY-MM-DD HH:MM:SS` when possible. Zero-padded values in
+    this format order the same as the datetimes they represent.
     """
     if timestamp is None:
         return None
 
     text = str(timestamp).strip()
-    match = re.search(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", text)
+    match = _DATETIME_TEXT_PATTERN.search(text)
     if match:
-        return match.group(1)
+        return match.group()
 
-    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", text):
+    if _DATE_TEXT_PATTERN.fullmatch(text):
         return f"{text} 00:00:00"
 
     return None
@@ -170,7 +208,7 @@ class StreamingCSVWriter:
             self.write_record(record)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DumpInfo:
     """Information about an available database dump."""
     name: str
@@ -178,12 +216,16 @@ class DumpInfo:
     size_bytes: int
     modified_date: datetime
     dump_type: str  # "daily"
+    size_mb: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "size_mb", round(self.size_bytes / (1024 * 1024), 2))
 
     def to_dict(self) -> dict[str, Any]:
         return {
             "name": self.name,
             "url": self.url,
-            "size_mb": round(self.size_bytes / (1024 * 1024), 2),
+            "size_mb": self.size_mb,
             "modified_date": self.modified_date.isoformat(),
             "dump_type": self.dump_type,
         }
@@ -228,6 +270,10 @@ class DumpManager:
         self._progress_lock = threading.Lock()
         self._progress: dict[str, Any] = self._empty_progress_state()
         self._background_thread: threading.Thread | None = None
+        # Per-import string reuse: dumps repeat a few thousand item ids and a
+        # handful of locations across millions of rows.
+        self._item_ids: dict[str, str] = {}
+        self._location_names: dict[int, str] = {}
 
     def _empty_progress_state(self) -> dict[str, Any]:
         return {
@@ -404,13 +450,12 @@ class DumpManager:
             response = await client.get(self.index_url)
             response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
         dumps: list[DumpInfo] = []
 
         # Parse Apache/nginx directory listing
         # Looking for daily .tgz snapshots
-        for link in soup.find_all("a"):
-            href = link.get("href", "")
+        for row in _LISTING_ROW_PATTERN.finditer(response.text):
+            href = row.group("href")
             if not href:
                 continue
 
@@ -430,33 +475,19 @@ class DumpManager:
             # Build full URL
             url = f"{self.index_url.rstrip('/')}/{href}"
 
-            # Try to extract size and date from page text
+            # Size and date follow the link on the same row
             # Apache format: "filename   date time   size"
-            size_bytes = 0
+            size_text = row.group("size")
+            size_bytes = int(size_text) if size_text else 0
             modified_date = datetime.now()
-
-            # Find the row text containing this link
-            parent = link.parent
-            if parent:
-                text = parent.get_text()
-                # Try to parse size (e.g., "569216651" or "568M")
-                size_match = re.search(r"(\d+)\s*$", text.strip())
-                if size_match:
-                    size_bytes = int(size_match.group(1))
-
-                # Try to parse date (e.g., "30-Jan-2026 01:02")
-                date_match = re.search(
-                    r"(\d{2}-\w{3}-\d{4})\s+(\d{2}:\d{2})",
-                    text
-                )
-                if date_match:
-                    try:
-                        modified_date = datetime.strptime(
-                            f"{date_match.group(1)} {date_match.group(2)}",
-                            "%d-%b-%Y %H:%M"
-                        )
-                    except ValueError:
-                        pass
+            if row.group("date"):
+                try:
+                    modified_date = datetime.strptime(
+                        f"{row.group('date')} {row.group('time')}",
+                        "%d-%b-%Y %H:%M"
+                    )
+                except ValueError:
+                    pass
 
             dumps.append(DumpInfo(
                 name=href,
@@ -471,9 +502,7 @@ class DumpManager:
 
     def _classify_dump(self, filename: str) -> str | None:
         """Classify a dump file by type."""
-        filename_lower = filename.lower()
-
-        if filename_lower.startswith("db_backup_"):
+        if _DAILY_DUMP_NAME_PATTERN.fullmatch(filename):
             return "daily"
 
         return None
@@ -495,7 +524,7 @@ class DumpManager:
         Policy:
         1. Import newest missing daily full snapshot that extends coverage.
         """
-        imported = set(self.db.get_imported_dumps())
+        imported = frozenset(self.db.get_imported_dumps())
         current_max = self._get_current_max_datetime()
 
         daily_snapshots = [
@@ -1012,6 +1041,7 @@ class DumpManager:
         csv_writer: StreamingCSVWriter,
     ) -> None:
         """Stream SQL content to CSV."""
+        self._item_ids.clear()
         copy_pattern = re.compile(
             r"^COPY\s+(?P<table>[^\s]+)\s*\((?P<columns>[^)]+)\)\s+FROM\s+stdin;?$",
             re.IGNORECASE,
@@ -1141,6 +1171,7 @@ class DumpManager:
         min_timestamp_exclusive: str | None = None,
     ) -> tuple[int, str | None, str | None]:
         """Import market data records from a PostgreSQL SQL stream."""
+        self._item_ids.clear()
         copy_pattern = re.compile(
             r"^COPY\s+(?P<table>[^\s]+)\s*\((?P<columns>[^)]+)\)\s+FROM\s+stdin;?$",
             re.IGNORECASE,
@@ -1291,7 +1322,7 @@ class DumpManager:
         if normalized is None:
             return None
         try:
-            return datetime.strptime(normalized, "%Y-%m-%d %H:%M:%S")
+            return datetime.fromisoformat(normalized)
         except ValueError:
             return None
 
@@ -1314,24 +1345,23 @@ class DumpManager:
 
     def _dump_coverage_end(self, dump_info: DumpInfo) -> datetime | None:
         """Estimate the latest timestamp represented by a dump filename."""
-        if dump_info.dump_type == "daily":
-            match = re.search(
-                r"db_backup_(\d{4})-(\d{2})-(\d{2})(?:T(\d{2})_(\d{2})_(\d{2}))?",
-                dump_info.name,
-            )
-            if match:
-                year = int(match.group(1))
-                month = int(match.group(2))
-                day = int(match.group(3))
-                if match.group(4) and match.group(5) and match.group(6):
-                    hour = int(match.group(4))
-                    minute = int(match.group(5))
-                    second = int(match.group(6))
-                    return datetime(year, month, day, hour, minute, second)
-                return datetime(year, month, day, 23, 59, 59)
+        coverage_end = self._dump_coverage_end_text(dump_info)
+        if coverage_end is None:
             return None
+        return datetime.fromisoformat(coverage_end)
 
-        return None
+    def _dump_coverage_end_text(self, dump_info: DumpInfo) -> str | None:
+        """Coverage end of a dump as a `YYYY-MM-DD HH:MM:SS` string."""
+        if dump_info.dump_type != "daily":
+            return None
+
+        match = _DAILY_DUMP_TS_PATTERN.search(dump_info.name)
+        if not match:
+            return None
+        date, hour, minute, second = match.groups()
+        if hour and minute and second:
+            return f"{date} {hour}:{minute}:{second}"
+        return f"{date} 23:59:59"
 
     def _is_dump_fully_covered(
         self,
@@ -1343,15 +1373,11 @@ class DumpManager:
         if normalized is None:
             return False
 
-        try:
-            current_max = datetime.strptime(normalized, "%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            return False
-
-        coverage_end = self._dump_coverage_end(dump_info)
+        coverage_end = self._dump_coverage_end_text(dump_info)
         if coverage_end is None:
             return False
-        return coverage_end <= current_max
+        # Both sides are zero-padded `YYYY-MM-DD HH:MM:SS`, so string order is time order.
+        return coverage_end <= normalized
 
     def _parse_copy_columns(self, columns_str: str) -> list[str]:
         columns = []
@@ -1363,11 +1389,16 @@ class DumpManager:
 
     def _split_copy_line(self, line: str) -> list[str | None]:
         fields = line.split("\t")
+        # Most COPY rows carry no escapes or NULLs; skip the per-field pass.
+        if "\\" not in line:
+            return fields
         return [self._unescape_copy_value(field) for field in fields]
 
     def _unescape_copy_value(self, value: str) -> str | None:
         if value == r"\N":
             return None
+        if "\\" not in value:
+            return value
 
         result = []
         i = 0
@@ -1414,10 +1445,10 @@ class DumpManager:
         location_id = self._parse_int(get_field("location") or "NULL")
         quality = self._parse_int(get_field("quality_level", "quality") or "NULL")
 
-        location = LOCATION_MAP.get(location_id, str(location_id)) if location_id else "Unknown"
+        location = self._location_name(location_id)
 
         return {
-            "item_id": item_id,
+            "item_id": self._item_ids.setdefault(item_id, item_id),
             "location": location,
             "quality": quality or 1,
             "timestamp": timestamp,
@@ -1449,14 +1480,19 @@ class DumpManager:
         line = line.rstrip(",;")
 
         # Find all tuples: (...)
-        # Use regex to find balanced parentheses with content
-        tuple_pattern = re.compile(r'\(([^()]+)\)')
-
-        for match in tuple_pattern.finditer(line):
+        for match in _SQL_TUPLE_PATTERN.finditer(line):
             values_str = match.group(1)
-            values = self._split_sql_values(values_str)
-
-            if len(values) >= 7:
+            fast = _AODP_VALUES_PATTERN.fullmatch(values_str)
+            if fast:
+                count_str, silver_str, item_id, location_str, quality_str, timestamp = fast.groups()
+                item_count = None if count_str == "NULL" else int(count_str)
+                silver_amount = None if silver_str == "NULL" else int(silver_str)
+                location_id = None if location_str == "NULL" else int(location_str)
+                quality = None if quality_str == "NULL" else int(quality_str)
+            else:
+                values = self._split_sql_values(values_str)
+                if len(values) < 7:
+                    continue
                 try:
                     # Parse according to AODP schema
                     item_count = self._parse_int(values[1])
@@ -1465,72 +1501,74 @@ class DumpManager:
                     location_id = self._parse_int(values[4])
                     quality = self._parse_int(values[5])
                     timestamp = self._clean_sql_string(values[6])
-
-                    # Map location ID to name (or keep as string if unknown)
-                    location = LOCATION_MAP.get(location_id, str(location_id)) if location_id else "Unknown"
-
-                    # Build record matching our schema
-                    record = {
-                        "item_id": item_id,
-                        "location": location,
-                        "quality": quality or 1,
-                        "timestamp": timestamp,
-                        "sell_price_min": silver_amount,  # AODP provides sell order prices
-                        "sell_price_max": silver_amount,
-                        "buy_price_min": None,
-                        "buy_price_max": None,
-                        "item_count": item_count,
-                    }
-
-                    if record["item_id"] and record["timestamp"]:
-                        records.append(record)
-
                 except Exception as e:
                     logger.debug("[DumpManager] Failed to parse tuple: %s", e)
+                    continue
+
+            if not item_id or not timestamp:
+                continue
+
+            # Build record matching our schema
+            records.append({
+                "item_id": self._item_ids.setdefault(item_id, item_id),
+                "location": self._location_name(location_id),
+                "quality": quality or 1,
+                "timestamp": timestamp,
+                "sell_price_min": silver_amount,  # AODP provides sell order prices
+                "sell_price_max": silver_amount,
+                "buy_price_min": None,
+                "buy_price_max": None,
+                "item_count": item_count,
+            })
 
         return records
 
+    def _location_name(self, location_id: int | None) -> str:
+        """Map an AODP location ID to its name (or keep as string if unknown)."""
+        if not location_id:
+            return "Unknown"
+        name = self._location_names.get(location_id)
+        if name is None:
+            name = self._location_names[location_id] = LOCATION_MAP.get(location_id, str(location_id))
+        return name
+
     def _split_sql_values(self, values_str: str) -> list[str]:
         """Split SQL values respecting quoted strings."""
-        values = []
-        current = ""
-        in_string = False
-        string_char = None
-
-        for char in values_str:
-            if char in ("'", '"') and not in_string:
-                in_string = True
-                string_char = char
-                current += char
-            elif char == string_char and in_string:
-                in_string = False
-                string_char = None
-                current += char
-            elif char == "," and not in_string:
-                values.append(current.strip())
-                current = ""
-            else:
-                current += char
-
-        if current:
-            values.append(current.strip())
-
+        if "'" not in values_str and '"' not in values_str:
+            values = values_str.split(",")
+            tail = values.pop()
+            values = [value.strip() for value in values]
+        else:
+            # Slice between top-level commas instead of building values char by char
+            values = []
+            start = 0
+            for token in _SQL_VALUE_TOKEN_PATTERN.finditer(values_str):
+                comma = token.start()
+                if values_str[comma] == ",":
+                    values.append(values_str[start:comma].strip())
+                    start = comma + 1
+            tail = values_str[start:]
+
+        # A trailing comma does not start another value
+        if tail:
+            values.append(tail.strip())
         return values
 
     def _clean_sql_string(self, value: str) -> str:
         """Remove SQL quotes from a string value."""
         value = value.strip()
-        if (value.startswith("'") and value.endswith("'")) or \
-           (value.startswith('"') and value.endswith('"')):
+        if value and value[0] in "'\"" and value[-1] == value[0]:
             value = value[1:-1]
         # Handle escaped quotes
-        value = value.replace("''", "'").replace('\\"', '"')
-        return value
+        return value.replace("''", "'").replace('\\"', '"')
 
     def _parse_int(self, value: str) -> int | None:
         """Parse an integer from SQL value."""
         value = value.strip()
-        if value.upper() == "NULL":
+        # Plain (optionally negative) digit runs are the common case.
+        if value.isdecimal() or (value[:1] == "-" and value[1:].isdecimal()):
+            return int(value)
+        if not value or value.upper() == "NULL":
             return None
         try:
             return int(value)
@@ -15,13 +15,19 @@ from typing import Any
 from .config import GameDataConfig
 from .gamedata import ensure_game_files
 
+try:
+    # Optional faster parser for the multi-megabyte items.json; both accept bytes.
+    from orjson import loads as _loads_items
+except ImportError:
+    _loads_items = json.loads
+
 logger = logging.getLogger(__name__)
 
 GAME_DATA_DIR = GameDataConfig().dir
 ITEMS_FILE = GAME_DATA_DIR / "items.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class CraftResource:
     """A single crafting resource requirement."""
     item_id: str
@@ -29,7 +35,7 @@ class CraftResource:
     max_return: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CraftingRecipe:
     """Crafting recipe for an item."""
     silver_cost: int = 0
@@ -38,7 +44,7 @@ class CraftingRecipe:
     resources: list[CraftResource] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemInfo:
     """Information about a game item."""
     unique_name: str
@@ -64,6 +70,11 @@ class ItemInfo:
     attack_range: float = 0
     attack_type: str = ""  # "melee", "ranged"
     raw_data: dict[str, Any] = field(default_factory=dict)
+    # Enchantment IP map including the base item (level 0); built once per item.
+    enchantment_ips_with_base: dict[int, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.enchantment_ips_with_base = {0: self.item_power, **self.enchantment_ips}
 
 
 class GameDatabase:
@@ -91,7 +102,7 @@ class GameDatabase:
             return
 
         try:
-            raw = json.loads(self._items_path.read_text(encoding="utf-8"))
+            raw = _loads_items(self._items_path.read_bytes())
         except Exception as exc:
             logger.error("[GameDB] Failed to load items: %s", exc)
             return
@@ -160,16 +171,20 @@ class GameDatabase:
                 if recipe:
                     recipes.append(recipe)
 
-        # Parse spell list from craftingspelllist
+        # Parse spell list from craftingspelllist. The XML->JSON dump collapses
+        # single-entry lists into a dict, so normalize raw_data in place to
+        # always hold a list of dicts for downstream consumers.
         spell_list: list[str] = []
         csl = data.get("craftingspelllist", {})
         if isinstance(csl, dict):
             spells = csl.get("craftspell", [])
             if isinstance(spells, dict):
                 spells = [spells]
-            for sp in spells:
-                if isinstance(sp, dict) and sp.get("@uniquename"):
-                    spell_list.append(sp["@uniquename"])
+            elif not isinstance(spells, list):
+                spells = []
+            spells = [sp for sp in spells if isinstance(sp, dict)]
+            csl["craftspell"] = spells
+            spell_list = [sp["@uniquename"] for sp in spells if sp.get("@uniquename")]
 
         # Parse enchantment IP values
         enchantment_ips: dict[int, int] = {}
@@ -23,6 +23,18 @@ logger = logging.getLogger(__name__)
 # Default database path
 DEFAULT_DB_PATH = Path(os.getenv("MARKET_HISTORY_DB", "data/history/market.duckdb"))
 
+# Per-item sell prices at or above this are placeholder/troll listings.
+_SELL_OUTLIER_CEILING = 995_999
+# Sell prices above this multiple of the (location, quality) median are outliers.
+_SELL_OUTLIER_MEDIAN_FACTOR = 5
+
+# Columns get_aggregated_history reads; item_id is only filtered on, so the
+# scan never has to materialise it.
+_AGGREGATE_SOURCE_COLUMNS = (
+    "timestamp, location, quality, "
+    "sell_price_min, sell_price_max, buy_price_min, buy_price_max, item_count"
+)
+
 # Schema definitions
 SCHEMA_SQL = """
 -- Main market history table
@@ -65,6 +77,52 @@ CREATE TABLE IF NOT EXISTS import_metadata (
 """
 
 
+_INSERT_RECORD_SQL = """
+    INSERT OR REPLACE INTO market_history
+    (item_id, location, quality, timestamp,
+     sell_price_min, sell_price_max, buy_price_min, buy_price_max, item_count)
+    VALUES (?, ?, ?, ?::TIMESTAMP, ?, ?, ?, ?, ?)
+"""
+
+# Batches smaller than this are bound with executemany; spooling a temp CSV
+# only pays off once a few rows share the set-based statement.
+_CSV_BATCH_MIN_ROWS = 4
+
+# Upserts one spooled insert_records() batch. Every value is written quoted and
+# NULL as a bare empty field, so ``allow_quoted_nulls = false`` keeps '' apart
+# from NULL. Columns are read as text and cast through DOUBLE, which is how a
+# bound Python int or float reaches the INTEGER columns in the insert above.
+_INSERT_CSV_BATCH_SQL = """
+    INSERT OR REPLACE INTO market_history
+    (item_id, location, quality, timestamp,
+     sell_price_min, sell_price_max, buy_price_min, buy_price_max, item_count)
+    SELECT item_id, location, quality::DOUBLE::INTEGER, timestamp::TIMESTAMP,
+           sell_price_min::DOUBLE::INTEGER, sell_price_max::DOUBLE::INTEGER,
+           buy_price_min::DOUBLE::INTEGER, buy_price_max::DOUBLE::INTEGER,
+           item_count::DOUBLE::INTEGER
+    FROM read_csv(?, header = false, delim = ',', quote = '"', escape = '"',
+                  allow_quoted_nulls = false,
+                  columns = {
+                      'seq': 'BIGINT', 'item_id': 'VARCHAR', 'location': 'VARCHAR',
+                      'quality': 'VARCHAR', 'timestamp': 'VARCHAR',
+                      'sell_price_min': 'VARCHAR', 'sell_price_max': 'VARCHAR',
+                      'buy_price_min': 'VARCHAR', 'buy_price_max': 'VARCHAR',
+                      'item_count': 'VARCHAR'
+                  })
+    QUALIFY row_number() OVER (
+        PARTITION BY item_id, location, quality::DOUBLE::INTEGER, timestamp::TIMESTAMP
+        ORDER BY seq DESC
+    ) = 1
+"""
+
+
+def _csv_field(value: Any) -> str:
+    """Quote a value for the batch CSV; None stays a bare (NULL) field."""
+    if value is None:
+        return ""
+    return '"' + str(value).replace('"', '""') + '"'
+
+
 @dataclass
 class MonthCoverage:
     """Data coverage for a single month."""
@@ -228,6 +286,14 @@ class HistoryDatabase:
         status = self.get_status()
         return status.to_dict()["coverage"]
 
+    def has_records(self) -> bool:
+        """Return True when the market history table holds at least one row."""
+        conn = self.connect()
+        try:
+            return conn.execute("SELECT 1 FROM market_history LIMIT 1").fetchone() is not None
+        except Exception:
+            return False
+
     def get_latest_timestamp(self) -> str | None:
         """Get the latest timestamp in the market history table."""
         conn = self.connect()
@@ -370,6 +436,7 @@ class HistoryDatabase:
         start_date: str | None = None,
         end_date: str | None = None,
         granularity: str = "daily",
+        exclude_outliers: bool = False,
     ) -> list[dict[str, Any]]:
         """Get aggregated price history (daily/weekly/monthly averages).
 
@@ -380,6 +447,8 @@ class HistoryDatabase:
             start_date: Optional start date
             end_date: Optional end date
             granularity: "hourly", "daily", "weekly", or "monthly"
+            exclude_outliers: Leave troll sell listings (at the price ceiling or
+                more than 5x the location/quality median) out of ``avg_sell_min``
 
         Returns:
             List of aggregated price records
@@ -432,6 +501,28 @@ class HistoryDatabase:
 
         where_clause = " AND ".join(conditions)
 
+        source = f"(SELECT {_AGGREGATE_SOURCE_COLUMNS} FROM market_history WHERE {where_clause})"
+        if exclude_outliers:
+            # Null out outlier sell prices in SQL so they never reach Python.
+            source = f"""(
+                SELECT *, CASE
+                    WHEN sell_min_per_item >= {_SELL_OUTLIER_CEILING}
+                        OR sell_min_per_item > {_SELL_OUTLIER_MEDIAN_FACTOR} * sell_min_median THEN NULL
+                    ELSE sell_min_per_item
+                END AS sell_min_clean
+                FROM (
+                    SELECT *, quantile_cont(
+                        CASE WHEN sell_min_per_item < {_SELL_OUTLIER_CEILING} THEN sell_min_per_item END, 0.5
+                    ) OVER (PARTITION BY location, quality) AS sell_min_median
+                    FROM (
+                        SELECT {_AGGREGATE_SOURCE_COLUMNS}, {sell_min_expr} AS sell_min_per_item
+                        FROM market_history
+                        WHERE {where_clause}
+                    )
+                )
+            )"""
+            sell_min_expr = "sell_min_clean"
+
         query = f"""
             SELECT
                 DATE_TRUNC('{trunc}', timestamp)::VARCHAR as period,
@@ -443,8 +534,7 @@ class HistoryDatabase:
                 CAST(ROUND(AVG({buy_max_expr})) AS INTEGER) as avg_buy_max,
                 SUM(item_count) as total_volume,
                 COUNT(*) as data_points
-            FROM market_history
-            WHERE {where_clause}
+            FROM {source}
             GROUP BY period, location, quality
             ORDER BY period DESC, location, quality
             LIMIT 1000
@@ -573,47 +663,57 @@ class HistoryDatabase:
                 ))
 
             try:
-                # Use executemany for bulk insert - much faster than individual inserts
-                conn.executemany("""
-                    INSERT OR REPLACE INTO market_history
-                    (item_id, location, quality, timestamp,
-                     sell_price_min, sell_price_max, buy_price_min, buy_price_max, item_count)
-                    VALUES (?, ?, ?, ?::TIMESTAMP, ?, ?, ?, ?, ?)
-                """, values)
-                
-                inserted += len(values)
-                logger.info(
-                    "[HistoryDB] Inserted batch %s, total: %s",
-                    i // batch_size + 1,
-                    inserted,
-                )
-            except Exception as e:
-                logger.error("[HistoryDB] Failed to insert batch: %s", e)
+                if len(values) < _CSV_BATCH_MIN_ROWS:
+                    conn.executemany(_INSERT_RECORD_SQL, values)
+                else:
+                    try:
+                        self._insert_batch_via_csv(conn, values)
+                    except Exception as e:
+                        logger.warning("[HistoryDB] CSV batch load failed, using executemany: %s", e)
+                        conn.executemany(_INSERT_RECORD_SQL, values)
+            except Exception as e2:
+                logger.error("[HistoryDB] Failed to insert batch: %s", e2)
                 # Fall back to individual inserts for this batch on error
-                for record in batch:
+                for row in values:
                     try:
-                        conn.execute("""
-                            INSERT OR REPLACE INTO market_history
-                            (item_id, location, quality, timestamp,
-                             sell_price_min, sell_price_max, buy_price_min, buy_price_max, item_count)
-                            VALUES (?, ?, ?, ?::TIMESTAMP, ?, ?, ?, ?, ?)
-                        """, [
-                            record.get("item_id"),
-                            record.get("location"),
-                            record.get("quality", 1),
-                            record.get("timestamp"),
-                            record.get("sell_price_min"),
-                            record.get("sell_price_max"),
-                            record.get("buy_price_min"),
-                            record.get("buy_price_max"),
-                            record.get("item_count"),
-                        ])
+                        conn.execute(_INSERT_RECORD_SQL, row)
                         inserted += 1
-                    except Exception as e2:
-                        logger.warning("[HistoryDB] Failed to insert record: %s", e2)
+                    except Exception as e3:
+                        logger.warning("[HistoryDB] Failed to insert record: %s", e3)
+                continue
+
+            inserted += len(values)
+            logger.info(
+                "[HistoryDB] Inserted batch %s, total: %s",
+                i // batch_size + 1,
+                inserted,
+            )
 
         return inserted
 
+    @staticmethod
+    def _insert_batch_via_csv(
+        conn: duckdb.DuckDBPyConnection,
+        values: list[tuple[Any, ...]],
+    ) -> None:
+        """Load one batch of record tuples through a temp CSV and ``read_csv``.
+
+        Binding rows one statement at a time is the bottleneck for large
+        batches, so the batch is spooled to disk and upserted in a single
+        set-based statement. A leading sequence column lets duplicate keys
+        keep the last row, matching row-by-row ``INSERT OR REPLACE``.
+        """
+        fd, csv_path = tempfile.mkstemp(prefix="history_batch_", suffix=".csv")
+        try:
+            with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+                f.writelines(
+                    f"{seq}," + ",".join(map(_csv_field, row)) + "\n"
+                    for seq, row in enumerate(values)
+                )
+            conn.execute(_INSERT_CSV_BATCH_SQL, [csv_path])
+        finally:
+            os.unlink(csv_path)
+
     def record_import(
         self,
         dump_name: str,
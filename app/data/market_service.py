@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Awaitable, Callable, Sequence
 
 from dateutil import parser as dateparser
 
@@ -19,6 +20,9 @@ logger = logging.getLogger(__name__)
 # AODP uses year-1 dates as sentinel for "no data recorded".
 _NO_DATA_YEAR = 1
 
+# Item ids per coalesced prices request; keeps the comma-joined URL short.
+_MAX_BATCH_ITEMS = 40
+
 
 @dataclass(frozen=True)
 class MarketServiceError(RuntimeError):
@@ -62,6 +66,124 @@ def _is_empty_entry(entry: dict[str, Any]) -> bool:
     )
 
 
+# Per-item outcome of a batch: the item's rows, or the error its lookup raised.
+_BatchResult = dict[str, list[dict[str, Any]] | Exception]
+
+
+@dataclass
+class _PendingPriceBatch:
+    future: asyncio.Future[_BatchResult]
+    item_ids: set[str] = field(default_factory=set)
+    task: asyncio.Task[None] | None = None
+
+
+class _PriceRequestBatcher:
+    """Coalesce concurrent price lookups into multi-item AODP requests.
+
+    The first lookup for a (cities, qualities) pair opens a batch and schedules
+    a flush ``window_s`` later; lookups arriving before then join that batch.
+    The flush issues one request for every collected item id and hands each
+    waiter the rows for its own item. If the combined request fails, each item
+    is retried on its own so one bad id only fails its own callers.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., Awaitable[list[dict[str, Any]]]],
+        window_s: float,
+    ) -> None:
+        self._fetch = fetch
+        self._window_s = window_s
+        self._pending: dict[tuple[tuple[str, ...], tuple[int, ...] | None], _PendingPriceBatch] = {}
+
+    async def submit(
+        self,
+        *,
+        item_id: str,
+        cities: list[str],
+        qualities: list[int] | None,
+    ) -> list[dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        key = (tuple(cities), tuple(qualities) if qualities else None)
+        batch = self._pending.get(key)
+        if (
+            batch is None
+            or batch.future.get_loop() is not loop
+            or len(batch.item_ids) >= _MAX_BATCH_ITEMS
+        ):
+            batch = _PendingPriceBatch(future=loop.create_future())
+            self._pending[key] = batch
+            batch.task = loop.create_task(self._flush(key, batch, cities, qualities))
+        batch.item_ids.add(item_id)
+        # Shield so one cancelled caller does not cancel the shared result.
+        by_item = await asyncio.shield(batch.future)
+        rows = by_item.get(item_id, [])
+        if isinstance(rows, Exception):
+            raise rows
+        return rows
+
+    async def _flush(
+        self,
+        key: tuple[tuple[str, ...], tuple[int, ...] | None],
+        batch: _PendingPriceBatch,
+        cities: list[str],
+        qualities: list[int] | None,
+    ) -> None:
+        try:
+            await asyncio.sleep(self._window_s)
+            if self._pending.get(key) is batch:
+                del self._pending[key]
+            item_ids = sorted(batch.item_ids)
+            try:
+                entries = await self._fetch(item_ids=item_ids, cities=cities, qualities=qualities)
+            except Exception as exc:
+                if len(item_ids) == 1:
+                    batch.future.set_exception(exc)
+                    return
+                result = await self._fetch_each(item_ids, cities, qualities)
+            else:
+                result = _group_entries_by_item(entries, item_ids)
+            batch.future.set_result(result)
+        finally:
+            # A cancelled flush must still release its waiters and its slot.
+            if self._pending.get(key) is batch:
+                del self._pending[key]
+            if not batch.future.done():
+                batch.future.cancel()
+
+    async def _fetch_each(
+        self,
+        item_ids: list[str],
+        cities: list[str],
+        qualities: list[int] | None,
+    ) -> _BatchResult:
+        """Retry a failed batch one item at a time, keeping per-item errors."""
+        outcomes = await asyncio.gather(
+            *(self._fetch(item_ids=[item_id], cities=cities, qualities=qualities) for item_id in item_ids),
+            return_exceptions=True,
+        )
+        result: _BatchResult = {}
+        for item_id, outcome in zip(item_ids, outcomes):
+            if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+                raise outcome
+            result[item_id] = outcome
+        return result
+
+
+def _group_entries_by_item(
+    entries: list[dict[str, Any]], item_ids: list[str]
+) -> dict[str, list[dict[str, Any]]]:
+    """Split a multi-item prices response back into per-item row lists."""
+    if len(item_ids) == 1:
+        return {item_ids[0]: entries}
+    grouped: dict[str, list[dict[str, Any]]] = {item_id.upper(): [] for item_id in item_ids}
+    for entry in entries:
+        bucket = grouped.get(str(entry.get("item_id", "")).upper())
+        if bucket is not None:
+            bucket.append(entry)
+    return {item_id: grouped[item_id.upper()] for item_id in item_ids}
+
+
 class MarketService:
     """Service layer for market data access and normalization."""
 
@@ -73,6 +195,7 @@ class MarketService:
         base_url: str | None = None,
         timeout_s: float | None = None,
         freshness_ttl_s: float | None = None,
+        batch_window_s: float | None = None,
     ) -> None:
         config = AODPConfig()
         self._cache = cache
@@ -81,6 +204,10 @@ class MarketService:
         self._timeout_s = timeout_s or config.timeout_s
         self._freshness_ttl_s = freshness_ttl_s if freshness_ttl_s is not None else config.freshness_ttl_s
         self._region = config.region
+        window_s = batch_window_s if batch_window_s is not None else config.batch_window_s
+        self._price_batcher = (
+            _PriceRequestBatcher(self._fetch_prices_batch, window_s) if window_s > 0 else None
+        )
 
     @classmethod
     def from_env(cls) -> "MarketService":
@@ -91,6 +218,7 @@ class MarketService:
             base_url=config.base_url,
             timeout_s=config.timeout_s,
             freshness_ttl_s=config.freshness_ttl_s,
+            batch_window_s=config.batch_window_s,
         )
 
     @property
@@ -218,7 +346,7 @@ class MarketService:
         return item
 
     @staticmethod
-    def _validate_cities(cities: list[str]) -> list[str]:
+    def _validate_cities(cities: Sequence[str]) -> list[str]:
         normalized = [city.strip() for city in cities if city and city.strip()]
         if not normalized:
             raise MarketServiceError("At least one city is required", status_code=400)
@@ -248,10 +376,21 @@ class MarketService:
         item_id: str,
         cities: list[str],
         qualities: list[int] | None,
+    ) -> list[dict[str, Any]]:
+        if self._price_batcher is None:
+            return await self._fetch_prices_batch(item_ids=[item_id], cities=cities, qualities=qualities)
+        return await self._price_batcher.submit(item_id=item_id, cities=cities, qualities=qualities)
+
+    async def _fetch_prices_batch(
+        self,
+        *,
+        item_ids: list[str],
+        cities: list[str],
+        qualities: list[int] | None,
     ) -> list[dict[str, Any]]:
         try:
             async with AODPClient(base_url=self._base_url, timeout_s=self._timeout_s) as client:
-                return await client.get_prices(item_id, locations=cities, qualities=qualities)
+                return await client.get_prices(",".join(item_ids), locations=cities, qualities=qualities)
         except AODPError as exc:
             raise MarketServiceError(str(exc), status_code=502) from exc
         except Exception as exc:
@@ -486,7 +625,7 @@ class MarketService:
         self,
         *,
         item: str,
-        cities: list[str],
+        cities: Sequence[str],
         quality: int | None = None,
         force_refresh: bool = False,
         max_age_s: float | None = None,
@@ -551,7 +690,7 @@ class MarketService:
         self,
         *,
         item: str,
-        cities: list[str],
+        cities: Sequence[str],
         quality: int | None = None,
         time_scale: str = "hourly",
         start_date: str | None = None,
@@ -10,7 +10,7 @@ import json
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from .config import GameDataConfig
 from .gamedata import ensure_game_files
@@ -472,6 +472,19 @@ class SpellDatabase:
             "sub_spells": all_sub_spells,
         }
 
+    def resolve_spell_chain_many(
+        self, spell_names: Iterable[str], max_depth: int = 3
+    ) -> dict[str, dict[str, Any] | None]:
+        """Resolve several spells in one call, keyed by the requested name.
+
+        Duplicate names are resolved once. Missing spells map to None.
+        """
+        resolved: dict[str, dict[str, Any] | None] = {}
+        for name in spell_names:
+            if name not in resolved:
+                resolved[name] = self.resolve_spell_chain(name, max_depth=max_depth)
+        return resolved
+
     def search_spells(self, query: str, limit: int = 20) -> list[dict[str, Any]]:
         """Search spells by name substring."""
         self._ensure_loaded()
@@ -8,6 +8,8 @@ import re
 from dataclasses import dataclass, field
 from typing import Any
 
+from .registry import dump_json_text
+
 logger = logging.getLogger(__name__)
 
 _FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
@@ -61,7 +63,7 @@ def format_tool_result(tool_name: str, result: Any, *, success: bool = True) ->
             elif tool_name == "market_data":
                 # Strip raw data array — summary carries the distilled answer.
                 result = {k: v for k, v in result.items() if k != "data"}
-        result_str = json.dumps(result, indent=2) if isinstance(result, dict) else str(result)
+        result_str = dump_json_text(result) if isinstance(result, dict) else str(result)
         return f"\u2713 {tool_name}:\n{result_str}"
     return f"\u2717 {tool_name} failed: {result}"
 
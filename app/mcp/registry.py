@@ -3,14 +3,56 @@
 from __future__ import annotations
 
 import json
+import math
 import re
 from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable, Literal
 
+try:
+    from orjson import OPT_INDENT_2, OPT_NON_STR_KEYS
+    from orjson import dumps as _orjson_dumps
+except ImportError:  # optional speedup
+    _orjson_dumps = None
+
 ToolHandler = Callable[[dict[str, Any]], Awaitable[Any]]
 ToolVisibility = Literal["public", "admin"]
 
 
+def _has_non_finite_float(data: Any) -> bool:
+    """Return True if a NaN or infinite float occurs anywhere in ``data``."""
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def dump_json_text(data: Any) -> str:
+    """Serialize a tool payload as indented JSON text.
+
+    Uses orjson when it is installed and falls back to the standard library
+    for payloads orjson rejects (e.g. integers wider than 64 bits) and for
+    non-finite floats, which orjson writes as ``null`` instead of ``NaN`` /
+    ``Infinity``.
+    """
+    if _orjson_dumps is not None:
+        try:
+            text = _orjson_dumps(data, option=OPT_INDENT_2 | OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+        else:
+            # Non-finite floats can only hide behind a "null" in the output.
+            if b"null" not in text or not _has_non_finite_float(data):
+                return text.decode()
+    return json.dumps(data, indent=2)
+
+
 # ---------------------------------------------------------------------------
 # Schema helpers
 # ---------------------------------------------------------------------------
@@ -148,7 +190,7 @@ class ToolResult:
     def json(cls, data: Any) -> ToolResult:
         """Create a result with both structured and text content."""
         return cls(
-            content=[{"type": "text", "text": json.dumps(data, indent=2)}],
+            content=[{"type": "text", "text": dump_json_text(data)}],
             structured_content=data,
         )
 
@@ -9,9 +9,9 @@ Provides tools for the agent to read and modify its own state:
 
 from __future__ import annotations
 
-import html
 import logging
 import re
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -32,6 +32,16 @@ ALLOWED_FILES = {
     "USER.md": "User preferences and profile",
     "CONFIG.md": "AI behavior settings",
 }
+_ALLOWED_FILES_LIST = list(ALLOWED_FILES)
+
+# Single-pass translation table equivalent to html.escape(value, quote=True).
+_XML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
 
 _PLACEHOLDER_VALUES = {
     "(not set)",
@@ -46,28 +56,43 @@ _PLACEHOLDER_VALUES = {
 def _get_file_path(filename: str) -> Path:
     """Get the full path for a prompt file."""
     if filename not in ALLOWED_FILES:
-        raise ValueError(f"Access denied: '{filename}' is not modifiable. Allowed: {list(ALLOWED_FILES.keys())}")
+        raise ValueError(f"Access denied: '{filename}' is not modifiable. Allowed: {_ALLOWED_FILES_LIST}")
     return PROMPTS_DIR / filename
 
 
-def _backup_file(path: Path) -> None:
-    """Create a backup of a file before modification."""
-    if path.exists():
-        backup_path = path.with_suffix(".md.bak")
-        backup_path.write_text(path.read_text(encoding="utf-8"), encoding="utf-8")
-        logger.info("Created backup: %s", backup_path)
+_LAST_MODIFIED_RE = re.compile(r"\*Last (?:modified|updated):.*\*")
+
+# (epoch minute, formatted "%Y-%m-%d %H:%M") of the last formatted timestamp.
+_TS_CACHE: tuple[int, str] = (-1, "")
+
+
+def _now_minute_ts() -> str:
+    """Return the current local time as "YYYY-MM-DD HH:MM", formatted once per minute."""
+    global _TS_CACHE
+    now = time.time()
+    minute = int(now // 60)
+    if minute != _TS_CACHE[0]:
+        _TS_CACHE = (minute, datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M"))
+    return _TS_CACHE[1]
+
+
+def _read_with_backup(path: Path) -> str:
+    """Read a state file and back it up from that same read.
+
+    Returns an empty string (and writes no backup) when the file is missing.
+    """
+    if not path.exists():
+        return ""
+    content = path.read_text(encoding="utf-8")
+    backup_path = path.with_suffix(".md.bak")
+    backup_path.write_text(content, encoding="utf-8")
+    logger.info("Created backup: %s", backup_path)
+    return content
 
 
 def _add_timestamp(content: str) -> str:
     """Update the 'Last modified' timestamp in content."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-    if "*Last modified:" in content or "*Last updated:" in content:
-        content = re.sub(
-            r"\*Last (modified|updated):.*\*",
-            f"*Last modified: {timestamp}*",
-            content,
-        )
-    return content
+    return _LAST_MODIFIED_RE.sub(f"*Last modified: {_now_minute_ts()}*", content)
 
 
 def _is_placeholder_value(value: str) -> bool:
@@ -103,19 +128,23 @@ def _append_to_slot_value(content: str, *, slot_id: str, entry: str) -> str | No
 
 def _append_to_markdown_section(content: str, *, section_header: str, entry: str) -> str:
     """Fallback appender for legacy markdown templates."""
-    if section_header in content:
-        pattern = rf"({re.escape(section_header)}.*?)(\n## |\n---|\Z)"
-        match = re.search(pattern, content, re.DOTALL)
-        if match:
-            section_end = match.end(1)
-            return content[:section_end] + entry + content[section_end:]
-        return content + entry
-    return content + f"\n{section_header}\n{entry}\n"
+    start = content.find(section_header)
+    if start < 0:
+        return content + f"\n{section_header}\n{entry}\n"
+
+    # The section ends at the next heading or horizontal rule, or at EOF.
+    search_from = start + len(section_header)
+    section_end = len(content)
+    for boundary in ("\n## ", "\n---"):
+        index = content.find(boundary, search_from)
+        if 0 <= index < section_end:
+            section_end = index
+    return content[:section_end] + entry + content[section_end:]
 
 
 def _escape_xml_text(value: str) -> str:
     """Escape text intended for XML-like element bodies."""
-    return html.escape(value, quote=True)
+    return value.translate(_XML_ESCAPE)
 
 
 def _format_memory_entry(*, timestamp: str, content: str) -> str:
@@ -146,7 +175,7 @@ def _format_skill_entry(*, name: str, description: str, steps: list[str], learne
     name="read_self",
     description="Read the agent's own state files (SOUL.md, MEMORY.md, SKILLS.md, USER.md, CONFIG.md).",
     params=[
-        Param("file", "string", "Which state file to read", required=True, enum=list(ALLOWED_FILES.keys())),
+        Param("file", "string", "Which state file to read", required=True, enum=_ALLOWED_FILES_LIST),
     ],
     annotations=READ_ONLY_LOCAL,
     visibility="admin",
@@ -164,13 +193,14 @@ async def read_self(args: dict[str, Any]) -> dict[str, Any]:
             "description": ALLOWED_FILES.get(filename),
         }
 
+    size_bytes = path.stat().st_size
     content = path.read_text(encoding="utf-8")
     return {
         "file": filename,
         "exists": True,
         "content": content,
         "description": ALLOWED_FILES.get(filename),
-        "size_bytes": len(content.encode("utf-8")),
+        "size_bytes": size_bytes,
     }
 
 
@@ -192,9 +222,7 @@ async def update_soul(args: dict[str, Any]) -> dict[str, Any]:
     reason = args.get("reason", "No reason provided")
 
     path = _get_file_path("SOUL.md")
-    _backup_file(path)
-
-    current_content = path.read_text(encoding="utf-8") if path.exists() else ""
+    current_content = _read_with_backup(path)
 
     if section:
         section_pattern = rf"(## {re.escape(section)}.*?)(?=\n## |\n---|\Z)"
@@ -238,9 +266,7 @@ async def save_memory(args: dict[str, Any]) -> dict[str, Any]:
     content = args["content"]
 
     path = _get_file_path("MEMORY.md")
-    _backup_file(path)
-
-    current_content = path.read_text(encoding="utf-8") if path.exists() else ""
+    current_content = _read_with_backup(path)
 
     slot_map = {
         "user_facts": "user_facts",
@@ -257,7 +283,7 @@ async def save_memory(args: dict[str, Any]) -> dict[str, Any]:
     if not slot_id or not section_header:
         raise ValueError(f"Invalid category: {category}. Use: {list(slot_map.keys())}")
 
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    timestamp = _now_minute_ts()
     xml_entry = _format_memory_entry(timestamp=timestamp, content=content)
     updated_content = _append_to_slot_value(current_content, slot_id=slot_id, entry=xml_entry)
 
@@ -301,11 +327,9 @@ async def learn_skill(args: dict[str, Any]) -> dict[str, Any]:
     steps = args["steps"]
 
     path = _get_file_path("SKILLS.md")
-    _backup_file(path)
-
-    current_content = path.read_text(encoding="utf-8") if path.exists() else ""
+    current_content = _read_with_backup(path)
 
-    timestamp = datetime.now().strftime("%Y-%m-%d")
+    timestamp = _now_minute_ts()[:10]
     xml_skill_entry = _format_skill_entry(
         name=name,
         description=description,
@@ -6,6 +6,8 @@ destiny board fame requirements, and item power progression.
 
 from __future__ import annotations
 
+import copy
+import functools
 from typing import Any
 
 from app.data.destiny_database import default_destiny_database
@@ -16,11 +18,14 @@ from app.mcp.tool_templates import READ_ONLY_LOCAL, item_param, limit_param, qua
 
 from ._resolve import attach_smart_resolution, capped_limit, resolve_with_smart_item
 
+# Module-level aliases are cheap: each database defers file download and
+# parsing to its first query (``_ensure_loaded``), so importing this module
+# never loads game data. Keeping the aliases lets tests patch them directly.
 game_db = default_game_database
 spell_db = default_spell_database
 destiny_db = default_destiny_database
 
-DESTINY_SLOT_TYPES = [
+DESTINY_SLOT_TYPES: tuple[str, ...] = (
     "mainhand_1h",
     "mainhand_2h",
     "offhand",
@@ -30,12 +35,23 @@ DESTINY_SLOT_TYPES = [
     "bag",
     "cape",
     "mount",
-]
+)
 _SPELL_SLOT_BY_ID = {"1": "Q", "2": "W", "3": "E"}
 
+# Error message templates for lookup misses.
+_NOT_FOUND_SPELL = "Spell '{}' not found"
+_NOT_FOUND_WEAPON = "Weapon '{}' not found"
+_NO_ABILITIES = "'{}' has no abilities (not a weapon?)"
+_NOT_FOUND_DESTINY_NODE = "Destiny node '{}' not found"
+_UNKNOWN_SLOT_TYPE = "Unknown slot type '{}'"
+
 
+@functools.lru_cache(maxsize=16)
 def _ip_scaling_payload(slot_type: str) -> dict[str, Any] | None:
-    """Build normalized IP scaling payload for a destiny slot."""
+    """Build normalized IP scaling payload for a destiny slot.
+
+    Cached per slot type; callers must copy before mutating.
+    """
     scaling = destiny_db.get_ip_scaling(slot_type)
     if not scaling:
         return None
@@ -49,21 +65,35 @@ def _ip_scaling_payload(slot_type: str) -> dict[str, Any] | None:
     }
 
 
+@functools.lru_cache(maxsize=2048)
+def _spell_chain_cached(query: str) -> dict[str, Any] | None:
+    """Resolve a spell chain once per query; callers must copy before mutating."""
+    return spell_db.resolve_spell_chain(query)
+
+
+@functools.lru_cache(maxsize=2048)
+def _fame_to_level_cached(node_id: str, from_level: int, to_level: int | None) -> dict[str, Any] | None:
+    """Fame requirements for a node/level window; callers must copy before mutating."""
+    return destiny_db.get_fame_to_level(node_id, from_level, to_level)
+
+
+def clear_caches() -> None:
+    """Drop memoized lookups, e.g. after the backing databases are reloaded or patched."""
+    _ip_scaling_payload.cache_clear()
+    _spell_chain_cached.cache_clear()
+    _fame_to_level_cached.cache_clear()
+
+
 def _weapon_spell_slot_map(raw_data: dict[str, Any]) -> dict[str, str]:
-    """Map spell unique names to user-facing slots (Q/W/E/passive)."""
-    csl = raw_data.get("craftingspelllist", {})
-    spell_entries = csl.get("craftspell", [])
-    if isinstance(spell_entries, dict):
-        spell_entries = [spell_entries]
-
-    slot_map: dict[str, str] = {}
-    for entry in spell_entries:
-        if not isinstance(entry, dict):
-            continue
-        spell_name = entry.get("@uniquename", "")
-        slots = entry.get("@slots", "")
-        slot_map[spell_name] = _SPELL_SLOT_BY_ID.get(slots, "passive")
-    return slot_map
+    """Map spell unique names to user-facing slots (Q/W/E/passive).
+
+    GameDatabase normalizes ``craftspell`` to a list of dicts at load time.
+    """
+    spell_entries = raw_data.get("craftingspelllist", {}).get("craftspell", ())
+    return {
+        entry.get("@uniquename", ""): _SPELL_SLOT_BY_ID.get(entry.get("@slots", ""), "passive")
+        for entry in spell_entries
+    }
 
 
 def _append_damage_summary(
@@ -121,14 +151,15 @@ def _weapon_ability_payload(spell_name: str, resolved: dict[str, Any]) -> dict[s
 async def spell_info(args: dict[str, Any]) -> dict[str, Any]:
     """Look up a spell/ability with resolved damage values."""
     query = args.get("spell", "")
-    result = spell_db.resolve_spell_chain(query)
+    result = _spell_chain_cached(query)
     if not result:
         return {
             "found": False,
             "query": query,
-            "error": f"Spell '{query}' not found",
+            "error": _NOT_FOUND_SPELL.format(query),
         }
-    return {"found": True, **result}
+    # Deep copy: the cached chain holds nested damage/effect lists.
+    return {"found": True, **copy.deepcopy(result)}
 
 
 @tool(
@@ -154,14 +185,14 @@ async def weapon_abilities(args: dict[str, Any]) -> dict[str, Any]:
         return {
             "found": False,
             "query": name_or_id,
-            "error": f"Weapon '{name_or_id}' not found",
+            "error": _NOT_FOUND_WEAPON.format(name_or_id),
         }
 
     if not item.spell_list:
         return {
             "found": False,
             "query": name_or_id,
-            "error": f"'{item.unique_name}' has no abilities (not a weapon?)",
+            "error": _NO_ABILITIES.format(item.unique_name),
         }
 
     # Get spell details for each ability, grouped by slot.
@@ -170,17 +201,13 @@ async def weapon_abilities(args: dict[str, Any]) -> dict[str, Any]:
     spell_slot_map = _weapon_spell_slot_map(item.raw_data)
 
     for spell_name in item.spell_list:
-        resolved = spell_db.resolve_spell_chain(spell_name)
+        resolved = _spell_chain_cached(spell_name)
         if not resolved:
             continue
 
         slot = spell_slot_map.get(spell_name, "passive")
         abilities[slot].append(_weapon_ability_payload(spell_name, resolved))
 
-    # Build enchantment IP map including base
-    enchantment_ips = {0: item.item_power}
-    enchantment_ips.update(item.enchantment_ips)
-
     result: dict[str, Any] = {
         "found": True,
         "weapon_id": item.unique_name,
@@ -190,7 +217,7 @@ async def weapon_abilities(args: dict[str, Any]) -> dict[str, Any]:
         "ability_power": item.ability_power,
         "ip_progression_type": item.ip_progression_type,
         "combat_spec_node": item.combat_spec_achievement,
-        "enchantment_ips": enchantment_ips,
+        "enchantment_ips": dict(item.enchantment_ips_with_base),
         "abilities": {k: v for k, v in abilities.items() if v},
         "note": "Damage values are base at weapon's ability power. Scale with Item Power.",
     }
@@ -222,17 +249,17 @@ async def destiny_fame(args: dict[str, Any]) -> dict[str, Any]:
     node_id = args["node"]
     from_level = args.get("from_level", 0)
     to_level = args.get("to_level")
-    fame = destiny_db.get_fame_to_level(node_id, from_level, to_level)
+    fame = _fame_to_level_cached(node_id, from_level, to_level)
     if not fame:
         return {
             "found": False,
             "node": node_id,
-            "error": f"Destiny node '{node_id}' not found",
+            "error": _NOT_FOUND_DESTINY_NODE.format(node_id),
         }
     return {
         "found": True,
         "node": fame["node_id"],
-        "fame": fame,
+        "fame": copy.deepcopy(fame),
     }
 
 
@@ -248,7 +275,7 @@ async def destiny_fame(args: dict[str, Any]) -> dict[str, Any]:
             "string",
             "Slot type to inspect: mainhand_1h, mainhand_2h, offhand, head, armor, shoes, bag, cape, mount",
             required=True,
-            enum=DESTINY_SLOT_TYPES,
+            enum=list(DESTINY_SLOT_TYPES),
         ),
         Param("include_base_stats", "boolean", "Include base character stats (HP, energy, premium bonuses)"),
     ],
@@ -262,12 +289,12 @@ async def destiny_ip_scaling(args: dict[str, Any]) -> dict[str, Any]:
         return {
             "found": False,
             "slot_type": slot_type,
-            "error": f"Unknown slot type '{slot_type}'",
+            "error": _UNKNOWN_SLOT_TYPE.format(slot_type),
         }
 
     result: dict[str, Any] = {
         "found": True,
-        "ip_scaling": scaling,
+        "ip_scaling": dict(scaling),
     }
     if args.get("include_base_stats"):
         result["base_stats"] = destiny_db.get_base_stats()
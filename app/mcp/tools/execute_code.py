@@ -6,19 +6,52 @@ restricted builtins, pre-imported safe modules, and a hard timeout.
 
 from __future__ import annotations
 
+import ast
 import asyncio
 import json
+import logging
+import marshal
+import operator
+import os
+import struct
+import subprocess
 import sys
 import textwrap
+import threading
+from collections import deque
 from typing import Any
 
 from app.mcp.registry import Param, tool
 from app.mcp.tool_templates import READ_ONLY_LOCAL
 
+try:
+    # Optional faster parser for result frames; both raise ValueError subclasses.
+    # Frames orjson rejects (e.g. lone surrogates) are retried with json.loads.
+    from orjson import loads as _loads_frame
+except ImportError:
+    _loads_frame = json.loads
+
+logger = logging.getLogger(__name__)
+
 _MAX_TIMEOUT = 30
 _DEFAULT_TIMEOUT = 5
 _MAX_OUTPUT_CHARS = 50_000
-_RESULT_DELIMITER = "__SANDBOX_RESULT_7f3a__"
+# Workers answer with a little-endian uint32 length followed by a JSON body.
+_FRAME_HEADER = struct.Struct("<I")
+# Upper bound on a result frame read from a worker. The printed output is
+# capped inside the worker, but the final expression's repr is not.
+_MAX_FRAME_BYTES = 16 * 1024 * 1024
+# Worker stderr only matters when the worker dies before answering.
+_MAX_STDERR_BYTES = _MAX_OUTPUT_CHARS * 2
+# Executions a ``fast`` worker serves before it is recycled.
+_WARM_MAX_CALLS = 100
+
+# Workers only need enough environment for the interpreter to start.
+_WORKER_ENV = {
+    key: os.environ[key]
+    for key in ("PATH", "LD_LIBRARY_PATH", "SYSTEMROOT")
+    if key in os.environ
+}
 
 # Builtins blocked in the sandbox (everything else is allowed).
 _BLOCKED_BUILTINS = {
@@ -32,32 +65,53 @@ _BLOCKED_BUILTINS = {
     "quit",          # ungraceful termination
 }
 
+# Operators the in-process fast path evaluates for pure numeric expressions.
+_FAST_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_FAST_UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+_FAST_NUMBER_TYPES = (int, float, complex)
+# Integers larger than this are left to the sandbox so the server never does
+# unbounded big-int arithmetic on the event loop.
+_FAST_MAX_INT_BITS = 4096
+
+# Observation sentences, one per combination of final result and printed output.
+_OBS_FAILED = "Execution failed with error: %s"
+_OBS_RESULT_WITH_OUTPUT = (
+    "Final expression produced %sresult %s. Printed output is available (first line: %r)."
+)
+_OBS_RESULT_NO_OUTPUT = "Final expression produced %sresult %s. No printed output."
+_OBS_NO_RESULT_WITH_OUTPUT = (
+    "No final expression result was produced. Printed output is available (first line: %r)."
+)
+_OBS_NO_RESULT_NO_OUTPUT = "No final expression result was produced. No printed output."
+
 # Modules pre-imported in the sandbox namespace.
 _SAFE_MODULES = ["math", "statistics", "decimal", "collections", "json", "itertools", "functools"]
 
 
-def _build_wrapper_script(user_code: str) -> str:
-    """Build the Python script that runs inside the subprocess."""
-    # Escape the user code for embedding in a triple-quoted string.
-    # We use base64 to avoid any quoting issues.
-    import base64
-
-    code_b64 = base64.b64encode(user_code.encode()).decode()
-
-    return textwrap.dedent(f"""\
-        import ast as _ast, base64 as _b64, io as _io, json as _json, sys as _sys
-
-        # Decode user code
-        _user_code = _b64.b64decode("{code_b64}").decode()
+# Script that runs inside each sandbox worker. Everything up to the first stdin
+# read (interpreter start-up, safe module imports, restricted builtins) happens
+# while the worker sits idle in the pool. Each request is a "<length>\n<bytes>"
+# frame on stdin carrying raw marshaled code objects compiled by the parent, and
+# each gets one result frame back. The worker exits at EOF, so one-shot callers
+# close stdin after their request.
+_WORKER_SCRIPT = textwrap.dedent(f"""\
+        import builtins as _builtins, io as _io, json as _json, marshal as _marshal, struct as _struct, sys as _sys
 
         # Import safe modules before restricting builtins
         import math, statistics, decimal, collections, json, itertools, functools
 
-        # Build restricted builtins: start with all, remove dangerous ones
+        # Build restricted builtins once: start with all, remove dangerous ones
         _blocked = {_BLOCKED_BUILTINS!r}
-        _builtins_src = __builtins__ if isinstance(__builtins__, dict) else __builtins__.__dict__
-        _original_import = _builtins_src["__import__"]
-        _safe = {{k: v for k, v in _builtins_src.items() if k not in _blocked}}
+        _original_import = _builtins.__import__
+        _SAFE_BUILTINS = {{k: v for k, v in vars(_builtins).items() if k not in _blocked}}
         _allowed_imports = set({_SAFE_MODULES!r})
 
         def _safe_import(name, globals=None, locals=None, fromlist=(), level=0):
@@ -71,11 +125,21 @@ def _build_wrapper_script(user_code: str) -> str:
                 )
             return _original_import(name, globals, locals, fromlist, level)
 
-        _safe["__import__"] = _safe_import
+        _SAFE_BUILTINS["__import__"] = _safe_import
+
+        # Capture stdout, dropping writes past the output cap so runaway prints stay bounded
+        class _CappedIO(_io.StringIO):
+            truncated = False
 
-        # Prepare namespace
-        _ns = {{
-            "__builtins__": _safe,
+            def write(self, s):
+                remaining = {_MAX_OUTPUT_CHARS} - self.tell()
+                if len(s) > remaining:
+                    self.truncated = True
+                    s = s[:max(remaining, 0)]
+                return super().write(s)
+
+        _BASE_NS = {{
+            "__builtins__": _SAFE_BUILTINS,
             "math": math,
             "statistics": statistics,
             "decimal": decimal,
@@ -84,46 +148,402 @@ def _build_wrapper_script(user_code: str) -> str:
             "itertools": itertools,
             "functools": functools,
         }}
+        _captured = _CappedIO()
+        _stdin = _sys.stdin.buffer
+        _stdout = _sys.__stdout__.buffer
+
+        while True:
+            # Wait for the next request frame; EOF means the parent is done with us
+            _header = _stdin.readline()
+            if not _header:
+                break
+            _length = int(_header)
+            _stmt_code, _expr_code = _marshal.loads(_stdin.read(_length))
+
+            # Fresh namespace with its own builtins (C-level dict copies) and a reset output buffer
+            _ns = dict(_BASE_NS, __builtins__=dict(_SAFE_BUILTINS))
+            _captured.seek(0)
+            _captured.truncate(0)
+            _captured.truncated = False
+            _sys.stdout = _captured
+            _sys.stderr = _captured
+
+            _error = None
+            _error_type = None
+            _result = None
+
+            try:
+                if _stmt_code is not None:
+                    exec(_stmt_code, _ns)
+                if _expr_code is not None:
+                    _result = eval(_expr_code, _ns)
+            except Exception as _e:
+                _error = f"{{type(_e).__name__}}: {{_e}}"
+                _error_type = type(_e).__name__
+
+            # Length-prefixed JSON result frame on the real stdout
+            _output = _captured.getvalue()
+            if _captured.truncated:
+                _output += "\\n... (truncated at {_MAX_OUTPUT_CHARS} chars)"
+            _result_repr = repr(_result) if _result is not None else None
+            _result_type = type(_result).__name__ if _result is not None else None
+            _frame = _json.dumps({{
+                "output": _output,
+                "result": _result_repr,
+                "result_type": _result_type,
+                "error": _error,
+                "error_type": _error_type,
+            }}).encode()
+            _stdout.write(_struct.pack("<I", len(_frame)) + _frame)
+            _stdout.flush()
+    """)
+
+
+class _NeedsSandbox(Exception):
+    """Raised when an expression is outside what the fast path evaluates."""
+
+
+def _eval_arithmetic(node: ast.AST) -> int | float | complex:
+    """Evaluate numeric literals combined with arithmetic operators only."""
+    if isinstance(node, ast.Constant):
+        if type(node.value) in _FAST_NUMBER_TYPES:
+            return node.value
+        raise _NeedsSandbox
+    if isinstance(node, ast.UnaryOp):
+        unary_op = _FAST_UNARY_OPS.get(type(node.op))
+        if unary_op is None:
+            raise _NeedsSandbox
+        return unary_op(_eval_arithmetic(node.operand))
+    if isinstance(node, ast.BinOp):
+        binary_op = _FAST_BINARY_OPS.get(type(node.op))
+        if binary_op is None:
+            raise _NeedsSandbox
+        left = _eval_arithmetic(node.left)
+        right = _eval_arithmetic(node.right)
+        if type(left) is int and type(right) is int:
+            if binary_op is operator.pow and right > 0 and left.bit_length() * right > _FAST_MAX_INT_BITS:
+                raise _NeedsSandbox
+            if binary_op is operator.mul and left.bit_length() + right.bit_length() > _FAST_MAX_INT_BITS:
+                raise _NeedsSandbox
+        return binary_op(left, right)
+    raise _NeedsSandbox
+
+
+def _try_fast_path(module: ast.Module) -> dict[str, Any] | None:
+    """Evaluate a lone arithmetic expression in-process, skipping the sandbox.
+
+    Only numeric literals and arithmetic operators are accepted, so no names,
+    attributes or calls are ever resolved in the server process. Returns None
+    when the snippet needs the full sandbox.
+    """
+    if len(module.body) != 1 or not isinstance(module.body[0], ast.Expr):
+        return None
+    try:
+        value = _eval_arithmetic(module.body[0].value)
+    except (_NeedsSandbox, RecursionError):
+        return None
+    except (ArithmeticError, ValueError, TypeError) as exc:
+        return _execution_payload(output="", result=None, result_type=None, error=f"{type(exc).__name__}: {exc}")
+    return _execution_payload(output="", result=repr(value), result_type=type(value).__name__, error=None)
+
+
+def _compile_user_code(module: ast.Module) -> bytes:
+    """Compile a parsed snippet and marshal it for a sandbox worker.
+
+    The final expression statement (if any) is compiled separately so its value
+    can be captured as the result. Returns marshaled ``(statements, expression)``
+    code objects, either of which may be None.
+    """
+    expr_code = None
+    if module.body and isinstance(module.body[-1], ast.Expr):
+        expr_module = ast.Expression(module.body.pop().value)
+        expr_code = compile(expr_module, "<code>", "eval", dont_inherit=True)
+    stmt_code = compile(module, "<code>", "exec", dont_inherit=True) if module.body else None
+    return marshal.dumps((stmt_code, expr_code))
+
+
+def _encode_request(compiled: bytes) -> bytes:
+    """Frame marshaled code as a request on a sandbox worker's stdin.
+
+    The decimal length line lets the worker read the raw bytes exactly, so the
+    payload needs no text-safe encoding.
+    """
+    return b"%d\n%s" % (len(compiled), compiled)
+
+
+def _spawn_worker() -> subprocess.Popen[bytes]:
+    # No preexec_fn or credential changes, so CPython keeps its vfork fast path.
+    # -I ignores PYTHON* variables and user site-packages; -S skips site.py,
+    # which the stdlib-only sandbox does not need.
+    return subprocess.Popen(
+        [sys.executable, "-I", "-S", "-c", _WORKER_SCRIPT],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=_WORKER_ENV,
+    )
+
+
+class _SandboxPool:
+    """Pre-spawned sandbox workers, each used for exactly one execution.
+
+    Workers pay interpreter start-up and safe-module imports while idle, so a
+    call only has to send its code. A worker is never reused: every execution
+    still gets a fresh process, preserving isolation between calls. Workers are
+    plain ``subprocess.Popen`` objects so the pool is not tied to one event loop;
+    idle workers exit on their own when the parent closes their stdin.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._idle: deque[subprocess.Popen[bytes]] = deque()
+        self._lock = threading.Lock()
+        self._refilling = False
+
+    def acquire(self) -> subprocess.Popen[bytes]:
+        """Hand out a warm worker (or a fresh one) and top the pool back up.
+
+        Blocks only when no warm worker is idle; the top-up runs on a
+        background thread so callers never wait for the replacements.
+        """
+        worker = None
+        with self._lock:
+            while self._idle and worker is None:
+                candidate = self._idle.popleft()
+                if candidate.poll() is None:
+                    worker = candidate
+        self._schedule_refill()
+        return worker if worker is not None else _spawn_worker()
+
+    def _schedule_refill(self) -> None:
+        with self._lock:
+            if self._refilling or len(self._idle) >= self._size:
+                return
+            self._refilling = True
+        threading.Thread(target=self._refill, name="sandbox-pool-refill", daemon=True).start()
+
+    def _refill(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    if len(self._idle) >= self._size:
+                        return
+                worker = _spawn_worker()
+                with self._lock:
+                    self._idle.append(worker)
+        except OSError as exc:
+            logger.warning("Failed to pre-spawn sandbox worker: %s", exc)
+        finally:
+            with self._lock:
+                self._refilling = False
+
+
+def _pool_size_from_env() -> int:
+    """Read ``EXECUTE_CODE_POOL_SIZE``, falling back to 2 on invalid values."""
+    raw = os.getenv("EXECUTE_CODE_POOL_SIZE", "2")
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("Ignoring invalid EXECUTE_CODE_POOL_SIZE=%r; using 2", raw)
+        return 2
+
+
+# Pre-spawned sandbox interpreters kept warm for upcoming calls.
+_pool = _SandboxPool(_pool_size_from_env())
+
+
+class _FrameTooLarge(Exception):
+    """Raised when a worker announces a result frame above ``_MAX_FRAME_BYTES``."""
+
+
+def _drain_capped(stream: Any, limit: int, sink: bytearray) -> None:
+    """Read ``stream`` to EOF, keeping at most ``limit`` bytes in ``sink``."""
+    while chunk := stream.read1(65536):
+        if len(sink) < limit:
+            sink += chunk[:limit - len(sink)]
+
+
+class _KillTimer:
+    """Kill a worker if it is still busy when ``timeout`` expires."""
+
+    def __init__(self, proc: subprocess.Popen[bytes], timeout: float) -> None:
+        self.expired = threading.Event()
+
+        def _expire() -> None:
+            self.expired.set()
+            proc.kill()
+
+        self._timer = threading.Timer(timeout, _expire)
+        self._timer.daemon = True
+
+    def __enter__(self) -> _KillTimer:
+        self._timer.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._timer.cancel()
+
+
+def _read_frame(stream: Any) -> bytes:
+    """Read one length-prefixed result frame (possibly short if the worker died)."""
+    frame = stream.read(_FRAME_HEADER.size)
+    if len(frame) == _FRAME_HEADER.size:
+        (length,) = _FRAME_HEADER.unpack(frame)
+        if length > _MAX_FRAME_BYTES:
+            raise _FrameTooLarge(f"result is {length} bytes (limit {_MAX_FRAME_BYTES})")
+        frame += stream.read(length)
+    return frame
+
+
+def _communicate_bounded(
+    proc: subprocess.Popen[bytes], request: bytes, timeout: float
+) -> tuple[bytes, bytes]:
+    """Send a request and read the worker's reply with bounded buffers.
+
+    Unlike ``Popen.communicate`` this reads exactly one result frame from
+    stdout and at most ``_MAX_STDERR_BYTES`` of stderr, so a misbehaving worker
+    cannot make the server buffer unbounded output. A timer kills the worker
+    when ``timeout`` expires, which unblocks the reads.
+    """
+    stderr_buf = bytearray()
+    stderr_reader = threading.Thread(
+        target=_drain_capped, args=(proc.stderr, _MAX_STDERR_BYTES, stderr_buf), daemon=True
+    )
+    stderr_reader.start()
+
+    try:
+        with _KillTimer(proc, timeout) as deadline:
+            try:
+                proc.stdin.write(request)
+                proc.stdin.close()
+            except BrokenPipeError:
+                # The worker already died; its stderr explains why.
+                pass
+            frame = _read_frame(proc.stdout)
+            proc.wait()
+            stderr_reader.join()
+    finally:
+        proc.stdout.close()
+
+    if deadline.expired.is_set():
+        raise subprocess.TimeoutExpired(proc.args, timeout)
+    return frame, bytes(stderr_buf)
+
+
+async def _run_in_worker(compiled: bytes, timeout: int) -> tuple[dict[str, Any] | None, bytes]:
+    """Run compiled code in a fresh pooled worker.
+
+    Returns the decoded result (None if the worker died without answering) and
+    its stderr. Raises ``subprocess.TimeoutExpired`` on timeout.
+    """
+    proc = await asyncio.to_thread(_pool.acquire)
+    try:
+        frame, stderr_bytes = await asyncio.to_thread(
+            _communicate_bounded, proc, _encode_request(compiled), timeout
+        )
+    except BaseException:
+        proc.kill()
+        await asyncio.to_thread(proc.wait)
+        raise
+    return _decode_result_frame(frame), stderr_bytes
+
+
+class _WarmWorkerBusy(Exception):
+    """The warm worker is serving another call."""
+
 
-        # Capture stdout
-        _captured = _io.StringIO()
-        _sys.stdout = _captured
-        _sys.stderr = _captured
+class _WarmWorker:
+    """A long-lived sandbox worker shared by ``fast`` executions.
 
-        _error = None
-        _error_type = None
-        _result = None
+    Skips process start-up entirely, at the cost of weaker isolation: each call
+    still gets a fresh namespace and builtins, but changes to the pre-imported
+    modules persist until the worker is replaced. Only one call runs at a time;
+    ``run`` raises ``_WarmWorkerBusy`` instead of queueing behind another call. The worker is replaced after any
+    failed execution, on timeout, and every ``max_calls`` executions.
+    """
 
+    def __init__(self, max_calls: int) -> None:
+        self._max_calls = max_calls
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._calls = 0
+        self._lock = threading.Lock()
+
+    def run(self, compiled: bytes, timeout: float) -> tuple[dict[str, Any] | None, bytes]:
+        """Execute on the warm worker; same contract as ``_run_in_worker``.
+
+        Raises ``_WarmWorkerBusy`` when another call holds the worker.
+        """
+        if not self._lock.acquire(blocking=False):
+            raise _WarmWorkerBusy
         try:
-            # Parse once with AST so we can reliably evaluate the final expression.
-            _module = _ast.parse(_user_code, filename="<code>", mode="exec")
-            if _module.body and isinstance(_module.body[-1], _ast.Expr):
-                _expr = _module.body.pop().value
-                if _module.body:
-                    _stmt_module = _ast.Module(body=_module.body, type_ignores=[])
-                    exec(compile(_stmt_module, "<code>", "exec"), _ns)
-                _expr_module = _ast.Expression(_expr)
-                _result = eval(compile(_expr_module, "<code>", "eval"), _ns)
-            else:
-                exec(compile(_module, "<code>", "exec"), _ns)
-        except Exception as _e:
-            _error = f"{{type(_e).__name__}}: {{_e}}"
-            _error_type = type(_e).__name__
-
-        # Output delimiter + JSON result
-        _sys.stdout = _sys.__stdout__
-        _output = _captured.getvalue()
-        _result_repr = repr(_result) if _result is not None else None
-        _result_type = type(_result).__name__ if _result is not None else None
-        print("{_RESULT_DELIMITER}")
-        print(_json.dumps({{
-            "output": _output[:50000],
-            "result": _result_repr,
-            "result_type": _result_type,
-            "error": _error,
-            "error_type": _error_type,
-        }}))
-    """)
+            if self._proc is None or self._proc.poll() is not None:
+                self._proc = _pool.acquire()
+                self._calls = 0
+            proc = self._proc
+
+            try:
+                with _KillTimer(proc, timeout) as deadline:
+                    try:
+                        proc.stdin.write(_encode_request(compiled))
+                        proc.stdin.flush()
+                    except BrokenPipeError:
+                        pass
+                    frame = _read_frame(proc.stdout)
+            except BaseException:
+                self._discard()
+                raise
+            if deadline.expired.is_set():
+                self._discard()
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+
+            self._calls += 1
+            result_data = _decode_result_frame(frame)
+            stderr_bytes = b""
+            if result_data is None or result_data.get("error") or self._calls >= self._max_calls:
+                stderr_bytes = self._discard()
+            return result_data, stderr_bytes
+        finally:
+            self._lock.release()
+
+    def _discard(self) -> bytes:
+        """Stop the current worker and return (capped) stderr it left behind."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return b""
+        proc.kill()
+        proc.wait()
+        stderr_buf = bytearray()
+        _drain_capped(proc.stderr, _MAX_STDERR_BYTES, stderr_buf)
+        for stream in (proc.stdin, proc.stdout, proc.stderr):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        return bytes(stderr_buf)
+
+
+_warm_worker = _WarmWorker(_WARM_MAX_CALLS)
+
+
+def _decode_result_frame(stdout_bytes: bytes) -> dict[str, Any] | None:
+    """Decode a worker's length-prefixed result frame; None if it is missing or corrupt."""
+    header_size = _FRAME_HEADER.size
+    if len(stdout_bytes) < header_size:
+        return None
+    (length,) = _FRAME_HEADER.unpack_from(stdout_bytes)
+    body = stdout_bytes[header_size:header_size + length]
+    if len(body) != length:
+        return None
+    try:
+        return _loads_frame(body)
+    except ValueError:
+        if _loads_frame is json.loads:
+            return None
+    # orjson rejects the lone-surrogate escapes json.dumps emits for odd str output.
+    try:
+        return json.loads(body)
+    except ValueError:
+        return None
 
 
 def _build_observation(
@@ -136,22 +556,43 @@ def _build_observation(
 ) -> str:
     """Create a concise execution summary for LLM reasoning."""
     if not success:
-        return f"Execution failed with error: {error}"
-
-    parts: list[str] = []
-    if result is not None:
-        type_prefix = f"{result_type} " if result_type else ""
-        parts.append(f"Final expression produced {type_prefix}result {result}.")
-    else:
-        parts.append("No final expression result was produced.")
+        return _OBS_FAILED % (error,)
 
     if output:
-        first_line = output.splitlines()[0].strip()
-        parts.append(f"Printed output is available (first line: {first_line!r}).")
-    else:
-        parts.append("No printed output.")
+        newline = output.find("\n")
+        first_line = (output if newline < 0 else output[:newline]).strip()
+        if result is None:
+            return _OBS_NO_RESULT_WITH_OUTPUT % (first_line,)
+        return _OBS_RESULT_WITH_OUTPUT % (result_type + " " if result_type else "", result, first_line)
+    if result is None:
+        return _OBS_NO_RESULT_NO_OUTPUT
+    return _OBS_RESULT_NO_OUTPUT % (result_type + " " if result_type else "", result)
+
 
-    return " ".join(parts)
+def _execution_payload(
+    *,
+    output: str,
+    result: str | None,
+    result_type: str | None,
+    error: str | None,
+) -> dict[str, Any]:
+    """Assemble the tool response for a finished (or rejected) execution."""
+    success = error is None
+    output = output.rstrip("\n") if output else ""
+    return {
+        "success": success,
+        "output": output,
+        "result": result,
+        "result_type": result_type,
+        "error": error,
+        "observation": _build_observation(
+            success=success,
+            output=output,
+            result=result,
+            result_type=result_type,
+            error=error,
+        ),
+    }
 
 
 @tool(
@@ -168,6 +609,9 @@ def _build_observation(
         Param("code", "string", "Python code to execute. Use print() for output. "
               "The result of the last expression is also captured.", required=True, min_length=1),
         Param("timeout", "integer", "Max execution time in seconds (default: 5, max: 30).", minimum=1, maximum=_MAX_TIMEOUT),
+        Param("fast", "boolean", "Reuse a warm interpreter for lower latency (default: false). "
+              "Variables and builtins are still fresh per call, but changes to pre-imported "
+              "modules may carry over between fast calls."),
     ],
     annotations=READ_ONLY_LOCAL,
     output_schema={
@@ -192,29 +636,33 @@ async def execute_code(args: dict[str, Any]) -> dict[str, Any]:
     if not code.strip():
         return {"success": False, "output": "", "result": None, "error": "No code provided"}
 
-    wrapper = _build_wrapper_script(code)
+    try:
+        module = ast.parse(code, filename="<code>", mode="exec")
+        fast_result = _try_fast_path(module)
+        if fast_result is not None:
+            return fast_result
+        compiled = _compile_user_code(module)
+    except Exception as exc:
+        # Syntax errors are reported without starting a sandbox.
+        return _execution_payload(output="", result=None, result_type=None, error=f"{type(exc).__name__}: {exc}")
 
     try:
-        proc = await asyncio.create_subprocess_exec(
-            sys.executable, "-c", wrapper,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout_bytes, stderr_bytes = await asyncio.wait_for(
-            proc.communicate(), timeout=timeout
-        )
-    except asyncio.TimeoutError:
         try:
-            proc.kill()
-            await proc.wait()
-        except Exception:
-            pass
+            if not args.get("fast", False):
+                raise _WarmWorkerBusy
+            result_data, stderr_bytes = await asyncio.to_thread(_warm_worker.run, compiled, timeout)
+        except _WarmWorkerBusy:
+            # Concurrent fast calls use a fresh worker rather than queueing.
+            result_data, stderr_bytes = await _run_in_worker(compiled, timeout)
+    except subprocess.TimeoutExpired:
         return {
             "success": False,
             "output": "",
             "result": None,
             "error": f"Execution timed out after {timeout}s",
         }
+    except _FrameTooLarge as exc:
+        return _execution_payload(output="", result=None, result_type=None, error=f"Result too large: {exc}")
     except Exception as exc:
         return {
             "success": False,
@@ -223,47 +671,17 @@ async def execute_code(args: dict[str, Any]) -> dict[str, Any]:
             "error": f"Failed to run subprocess: {exc}",
         }
 
-    raw_stdout = stdout_bytes.decode("utf-8", errors="replace")
-
-    # Parse the delimiter-separated output
-    if _RESULT_DELIMITER in raw_stdout:
-        parts = raw_stdout.split(_RESULT_DELIMITER, 1)
-        user_output = parts[0]
-        try:
-            result_data = json.loads(parts[1].strip())
-            output = result_data.get("output", user_output)
-            result_val = result_data.get("result")
-            result_type = result_data.get("result_type")
-            error = result_data.get("error")
-        except (json.JSONDecodeError, IndexError):
-            output = user_output
-            result_val = None
-            result_type = None
-            error = None
+    if result_data is not None:
+        output = result_data.get("output", "")
+        result_val = result_data.get("result")
+        result_type = result_data.get("result_type")
+        error = result_data.get("error")
     else:
-        # Subprocess crashed or didn't reach the delimiter
-        output = raw_stdout
+        # Worker crashed before writing its result frame
+        output = ""
         result_val = None
         result_type = None
         stderr_text = stderr_bytes.decode("utf-8", errors="replace").strip()
         error = stderr_text if stderr_text else "Execution failed (no result produced)"
 
-    # Truncate output if needed
-    if len(output) > _MAX_OUTPUT_CHARS:
-        output = output[:_MAX_OUTPUT_CHARS] + f"\n... (truncated at {_MAX_OUTPUT_CHARS} chars)"
-
-    success = error is None
-    return {
-        "success": success,
-        "output": output.rstrip("\n") if output else "",
-        "result": result_val,
-        "result_type": result_type,
-        "error": error,
-        "observation": _build_observation(
-            success=success,
-            output=output.rstrip("\n") if output else "",
-            result=result_val,
-            result_type=result_type,
-            error=error,
-        ),
-    }
+    return _execution_payload(output=output, result=result_val, result_type=result_type, error=error)
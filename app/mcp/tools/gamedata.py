@@ -6,6 +6,9 @@ and searching the game database.
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from app.data.activity_catalog import default_activity_catalog
@@ -52,6 +55,11 @@ _ITEM_NUMERIC_MODIFIERS: dict[str, str] = {
     "@threatbonus": "threat_bonus",
 }
 
+# unique_name -> (raw_data it was parsed from, parsed modifiers). Keyed on the
+# raw_data identity too, so a reloaded database never serves stale modifiers.
+_MODIFIER_CACHE: dict[str, tuple[dict[str, Any], dict[str, int | float]]] = {}
+_MODIFIER_CACHE_SIZE = 8192
+
 _QUALITY_NAMES = {
     1: "Normal",
     2: "Good",
@@ -59,7 +67,8 @@ _QUALITY_NAMES = {
     4: "Excellent",
     5: "Masterpiece",
 }
-_OPTIONAL_SPELL_FIELDS = (
+# Membership set; output order follows the resolver's own key order.
+_OPTIONAL_SPELL_FIELDS = frozenset((
     "category",
     "cooldown",
     "energy_cost",
@@ -69,16 +78,17 @@ _OPTIONAL_SPELL_FIELDS = (
     "effects",
     "buffs",
     "crowd_control",
-)
+))
 
 
 def _to_number(value: Any) -> int | float | None:
-    if isinstance(value, bool) or value is None:
-        return None
-    if isinstance(value, int):
-        return value
-    if isinstance(value, float):
+    # Exact type checks first: parsed game data is almost always a plain
+    # int/float/str, and ``type(x) is`` skips the subclass walk isinstance does.
+    value_type = type(value)
+    if value_type is int or value_type is float:
         return value
+    if value_type is bool or value is None:
+        return None
     if isinstance(value, str):
         stripped = value.strip()
         if not stripped:
@@ -88,6 +98,8 @@ def _to_number(value: Any) -> int | float | None:
         except ValueError:
             return None
         return int(parsed) if parsed.is_integer() else parsed
+    if isinstance(value, (int, float)):
+        return value
     return None
 
 
@@ -132,31 +144,53 @@ def _extract_maxload_buffs(item_effects: list[dict[str, Any]]) -> list[dict[str,
     return buffs
 
 
+@functools.lru_cache(maxsize=8)
+def _quality_bonus_cached(quality: int) -> int:
+    """Item power bonus for a quality level; destiny data is static per process."""
+    return destiny_db.get_quality_bonus(quality)
+
+
+@functools.lru_cache(maxsize=4096)
+def _item_power_profiles_cached(
+    tier: int,
+    item_power: int,
+    enchantment_ips: tuple[tuple[int, int], ...],
+    max_quality: int,
+) -> tuple[dict[int, int], dict[int, int], tuple[Mapping[str, Any], ...]]:
+    """Build the per-enchantment/per-quality grid once per distinct item shape.
+
+    Rows are read-only mappings; the two lookup dicts must be copied by callers.
+    """
+    enchantment_item_power = {0: item_power, **dict(enchantment_ips)}
+    quality_levels = range(1, min(max_quality, 5) + 1)
+    quality_ip_bonus = {quality: _quality_bonus_cached(quality) for quality in quality_levels}
+
+    profiles = tuple(
+        MappingProxyType({
+            "tier": f"{tier}.{enchantment}",
+            "enchantment": enchantment,
+            "quality": quality,
+            "quality_name": _QUALITY_NAMES.get(quality, f"Q{quality}"),
+            "item_power": int(enchant_ip + quality_ip_bonus[quality]),
+        })
+        for enchantment, enchant_ip in sorted(enchantment_item_power.items())
+        for quality in quality_levels
+    )
+    return enchantment_item_power, quality_ip_bonus, profiles
+
+
 def _build_item_power_profiles(
     item: Any,
-) -> tuple[dict[int, int], dict[int, int], list[dict[str, Any]]] | None:
+) -> tuple[dict[int, int], dict[int, int], tuple[Mapping[str, Any], ...]] | None:
     """Build reusable per-enchantment/per-quality item power rows."""
-    enchantment_item_power = {0: int(item.item_power)}
-    enchantment_item_power.update({int(k): int(v) for k, v in item.enchantment_ips.items()})
-    quality_levels = list(range(1, min(int(item.max_quality), 5) + 1))
-
+    enchantment_ips = tuple(sorted((int(k), int(v)) for k, v in item.enchantment_ips.items()))
     try:
-        quality_ip_bonus = {quality: destiny_db.get_quality_bonus(quality) for quality in quality_levels}
+        enchantment_item_power, quality_ip_bonus, profiles = _item_power_profiles_cached(
+            item.tier, int(item.item_power), enchantment_ips, int(item.max_quality)
+        )
     except Exception:
         return None
-
-    profiles: list[dict[str, Any]] = []
-    for enchantment, enchant_ip in sorted(enchantment_item_power.items()):
-        for quality in quality_levels:
-            item_power = int(enchant_ip + quality_ip_bonus[quality])
-            profiles.append({
-                "tier": f"{item.tier}.{enchantment}",
-                "enchantment": enchantment,
-                "quality": quality,
-                "quality_name": _QUALITY_NAMES.get(quality, f"Q{quality}"),
-                "item_power": item_power,
-            })
-    return enchantment_item_power, quality_ip_bonus, profiles
+    return dict(enchantment_item_power), dict(quality_ip_bonus), profiles
 
 
 def _build_max_load_payload(item: Any, item_effects: list[dict[str, Any]]) -> dict[str, Any] | None:
@@ -183,27 +217,30 @@ def _build_max_load_payload(item: Any, item_effects: list[dict[str, Any]]) -> di
         return None
     enchantment_item_power, quality_ip_bonus, item_power_profiles = profile_data
 
+    # The load curve depends only on item power, so evaluate it once per
+    # profile row and share it across every maxload buff on the item.
+    base_ability_power = float(item.ability_power)
+    load_curve = [
+        (
+            (base_ability_power * ability_power_progression ** (profile["item_power"] / 100.0))
+            / base_damage
+        ) ** load_progression - 1.0
+        for profile in item_power_profiles
+    ]
+
     profiles: list[dict[str, Any]] = []
     for buff in maxload_buffs:
         buff_value = float(buff["value"])
         ignore_ability_scaling = bool(buff["ignore_ability_power_scaling"])
-        values: list[dict[str, Any]] = []
-
-        for profile in item_power_profiles:
-            item_power = int(profile["item_power"])
-            if ignore_ability_scaling:
-                scaled_value = buff_value
-            else:
-                ability_power_at_ip = float(item.ability_power) * (
-                    ability_power_progression ** (item_power / 100.0)
-                )
-                scaled_value = buff_value * base_load * (
-                    ((ability_power_at_ip / base_damage) ** load_progression) - 1.0
-                )
-            values.append({
-                **profile,
-                "max_load_kg": int(round(scaled_value)),
-            })
+        if ignore_ability_scaling:
+            flat_value = int(round(buff_value))
+            values = [{**profile, "max_load_kg": flat_value} for profile in item_power_profiles]
+        else:
+            scale = buff_value * base_load
+            values = [
+                {**profile, "max_load_kg": int(round(scale * curve))}
+                for profile, curve in zip(item_power_profiles, load_curve)
+            ]
 
         profiles.append({
             "source_spell": buff["source_spell"],
@@ -290,30 +327,41 @@ def _build_cape_energy_payload(item: Any) -> dict[str, Any] | None:
     }
 
 
-def _item_stats_payload(
-    item: Any, *, item_effects: list[dict[str, Any]] | None = None
-) -> dict[str, Any]:
-    enchantment_ips = {0: item.item_power}
-    enchantment_ips.update(item.enchantment_ips)
+def _item_modifiers(unique_name: str, raw_data: dict[str, Any]) -> dict[str, int | float]:
+    """Parse numeric stat modifiers once per item; callers must copy before mutating."""
+    cached = _MODIFIER_CACHE.get(unique_name)
+    if cached is not None and cached[0] is raw_data:
+        return cached[1]
 
     modifiers: dict[str, int | float] = {}
-    raw_data = item.raw_data if isinstance(item.raw_data, dict) else {}
     for raw_key, output_key in _ITEM_NUMERIC_MODIFIERS.items():
         numeric = _to_number(raw_data.get(raw_key))
         if numeric in (None, 0, 0.0):
             continue
         modifiers[output_key] = numeric
 
+    if len(_MODIFIER_CACHE) >= _MODIFIER_CACHE_SIZE:
+        _MODIFIER_CACHE.clear()
+    _MODIFIER_CACHE[unique_name] = (raw_data, modifiers)
+    return modifiers
+
+
+def _item_stats_payload(
+    item: Any, *, item_effects: list[dict[str, Any]] | None = None
+) -> dict[str, Any]:
+    raw_data = item.raw_data if isinstance(item.raw_data, dict) else {}
+    modifiers = _item_modifiers(item.unique_name, raw_data)
+
     payload: dict[str, Any] = {
         "item_power": item.item_power,
         "ability_power": item.ability_power,
         "two_handed": item.two_handed,
         "ip_progression_type": item.ip_progression_type,
         "combat_spec_node": item.combat_spec_achievement,
-        "enchantment_item_power": enchantment_ips,
+        "enchantment_item_power": dict(item.enchantment_ips_with_base),
     }
     if modifiers:
-        payload["modifiers"] = modifiers
+        payload["modifiers"] = dict(modifiers)
     # Weapon auto-attack stats
     if item.attack_damage:
         payload["attack_damage"] = item.attack_damage
@@ -336,10 +384,13 @@ def _item_stats_payload(
 def _item_effects_payload(item: Any) -> list[dict[str, Any]]:
     spell_entries = game_db.get_item_spell_entries(item.unique_name)
     effects: list[dict[str, Any]] = []
+    resolved_spells = spell_db.resolve_spell_chain_many(
+        entry["spell_id"] for entry in spell_entries
+    )
 
     for spell_entry in spell_entries:
         spell_id = spell_entry["spell_id"]
-        resolved = spell_db.resolve_spell_chain(spell_id)
+        resolved = resolved_spells[spell_id]
         if not resolved:
             effects.append({
                 "spell_id": spell_id,
@@ -352,18 +403,23 @@ def _item_effects_payload(item: Any) -> list[dict[str, Any]]:
             "name": resolved["display_name"],
             "slot": spell_entry["slot"],
         }
-        for field in _OPTIONAL_SPELL_FIELDS:
-            value = resolved.get(field)
-            if value:
+        for field, value in resolved.items():
+            if value and field in _OPTIONAL_SPELL_FIELDS:
                 payload[field] = value
         effects.append(payload)
 
     return effects
 
 
+@functools.lru_cache(maxsize=1024)
+def _activity_matches_cached(query_lower: str, limit: int) -> tuple[dict[str, Any], ...]:
+    """Activity matches for a (case-insensitive) query; callers must copy before mutating."""
+    return tuple(activity_catalog.search(query=query_lower, limit=limit))
+
+
 def _activity_hint(query: str, limit: int = 3) -> dict[str, Any] | None:
     """Return activity guidance when a query appears to be a game mode, not an item."""
-    matches = activity_catalog.search(query=query, limit=limit)
+    matches = _activity_matches_cached(query.lower(), limit)
     if not matches:
         return None
     return {
@@ -372,7 +428,7 @@ def _activity_hint(query: str, limit: int = 3) -> dict[str, Any] | None:
             "Use `search_activities` for activity lookup."
         ),
         "count": len(matches),
-        "activities": matches,
+        "activities": [dict(match) for match in matches],
     }
 
 
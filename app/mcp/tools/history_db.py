@@ -14,6 +14,7 @@ from app.mcp.tool_templates import (
 
 logger = logging.getLogger(__name__)
 market_app = get_container().market
+history_db = get_container().history_db
 
 
 @tool(
@@ -26,7 +27,7 @@ market_app = get_container().market
 )
 async def db_status(args: dict[str, Any]) -> dict[str, Any]:
     """Get database status and coverage, optionally check for updates."""
-    status = get_container().history_db.get_status()
+    status = history_db.get_status()
 
     result: dict[str, Any] = {
         "initialized": status.initialized,
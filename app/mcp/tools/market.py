@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import statistics
-from typing import Any
+from typing import Any, NamedTuple
 
 from app.bootstrap import get_container
 from app.mcp.registry import Param, tool
@@ -22,7 +21,7 @@ from ._resolve import attach_smart_resolution, resolve_item_smart
 market_app = get_container().market
 history_db = get_container().history_db
 
-DEFAULT_CITIES = [
+DEFAULT_CITIES: tuple[str, ...] = (
     "Caerleon",
     "Bridgewatch",
     "Martlock",
@@ -31,12 +30,20 @@ DEFAULT_CITIES = [
     "Lymhurst",
     "Black Market",
     "Brecilien",
-]
+)
 
 # Prices at or above this are almost certainly placeholder/troll listings.
 _OUTLIER_CEILING = 995_999
 
 
+class _PriceEntry(NamedTuple):
+    """Best listing for one city on one side of the book."""
+
+    location: str
+    price: int
+    date: str | None
+
+
 def _summarize_prices(data: list[dict[str, Any]]) -> dict[str, Any]:
     """Build a clean price summary by filtering outlier/placeholder listings.
 
@@ -48,8 +55,8 @@ def _summarize_prices(data: list[dict[str, Any]]) -> dict[str, Any]:
     sell price and highest buy price per city are kept.
     """
     # Collect candidates keyed by location so we keep the best per city.
-    sell_by_loc: dict[str, dict[str, Any]] = {}
-    buy_by_loc: dict[str, dict[str, Any]] = {}
+    sell_by_loc: dict[str, _PriceEntry] = {}
+    buy_by_loc: dict[str, _PriceEntry] = {}
 
     for entry in data:
         loc = entry.get("location", "?")
@@ -57,48 +64,62 @@ def _summarize_prices(data: list[dict[str, Any]]) -> dict[str, Any]:
         sell_min = entry.get("sell_price_min", 0)
         if sell_min and sell_min > 0:
             prev = sell_by_loc.get(loc)
-            if prev is None or sell_min < prev["price"]:
-                sell_by_loc[loc] = {"location": loc, "price": sell_min, "date": entry.get("sell_price_min_date")}
+            if prev is None or sell_min < prev.price:
+                sell_by_loc[loc] = _PriceEntry(loc, sell_min, entry.get("sell_price_min_date"))
 
         buy_max = entry.get("buy_price_max", 0)
         if buy_max and buy_max > 0:
             prev = buy_by_loc.get(loc)
-            if prev is None or buy_max > prev["price"]:
-                buy_by_loc[loc] = {"location": loc, "price": buy_max, "date": entry.get("buy_price_max_date")}
+            if prev is None or buy_max > prev.price:
+                buy_by_loc[loc] = _PriceEntry(loc, buy_max, entry.get("buy_price_max_date"))
 
-    sell_entries = list(sell_by_loc.values())
-    buy_entries = list(buy_by_loc.values())
+    summary: dict[str, Any] = {}
+    summary["best_sell"], sell_prices = _best_and_prices(sell_by_loc, high_outliers=True)
+    if sell_prices is not None:
+        summary["sell_prices"] = sell_prices
+    summary["best_buy"], buy_prices = _best_and_prices(buy_by_loc, high_outliers=False)
+    if buy_prices is not None:
+        summary["buy_prices"] = buy_prices
+    return summary
 
-    # Filter outliers using median-based detection
-    clean_sells = _filter_outliers(sell_entries)
-    clean_buys = _filter_outliers(buy_entries, high_outliers=False)
 
-    summary: dict[str, Any] = {}
+def _best_and_prices(
+    by_loc: dict[str, _PriceEntry],
+    *,
+    high_outliers: bool,
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """Filter one side of the book and pick its best entry in a single pass.
 
-    if clean_sells:
-        best = min(clean_sells, key=lambda e: e["price"])
-        summary["best_sell"] = {"location": best["location"], "price": best["price"], "date": best["date"]}
-        if len(clean_sells) > 1:
-            summary["sell_prices"] = {e["location"]: e["price"] for e in clean_sells}
-    else:
-        summary["best_sell"] = None
+    Returns the best entry (lowest sell / highest buy) and, when more than one
+    city survives filtering, a location -> price map.
+    """
+    clean = _filter_outliers(list(by_loc.values()), high_outliers=high_outliers)
+    if not clean:
+        return None, None
 
-    if clean_buys:
-        best = max(clean_buys, key=lambda e: e["price"])
-        summary["best_buy"] = {"location": best["location"], "price": best["price"], "date": best["date"]}
-        if len(clean_buys) > 1:
-            summary["buy_prices"] = {e["location"]: e["price"] for e in clean_buys}
-    else:
-        summary["best_buy"] = None
+    best = clean[0]
+    prices: dict[str, Any] = {}
+    for entry in clean:
+        price = entry.price
+        prices[entry.location] = price
+        if (price < best.price) if high_outliers else (price > best.price):
+            best = entry
+    return best._asdict(), prices if len(clean) > 1 else None
 
-    return summary
+
+def _median_of_sorted(values: list[float]) -> float:
+    """Return the median of an already-sorted, non-empty list."""
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) / 2
 
 
 def _filter_outliers(
-    entries: list[dict[str, Any]],
+    entries: list[_PriceEntry],
     *,
     high_outliers: bool = True,
-) -> list[dict[str, Any]]:
+) -> list[_PriceEntry]:
     """Remove outlier prices using two-pass median filtering.
 
     For sell prices (high_outliers=True):
@@ -110,19 +131,20 @@ def _filter_outliers(
     if not entries:
         return []
 
+    # Work on a flat price column and select entries once at the end.
+    prices = [e.price for e in entries]
     if high_outliers:
         # Pass 1: remove obvious ceiling-level trolls
-        survivors = [e for e in entries if e["price"] < _OUTLIER_CEILING]
-        if not survivors:
+        below_ceiling = [p for p in prices if p < _OUTLIER_CEILING]
+        if not below_ceiling:
             return []
         # Pass 2: median-based filter on remaining values
-        med = statistics.median([e["price"] for e in survivors])
-        threshold = max(med * 5, 1)
-        return [e for e in survivors if e["price"] <= threshold]
+        below_ceiling.sort()
+        threshold = max(_median_of_sorted(below_ceiling) * 5, 1)
+        return [e for e, p in zip(entries, prices) if p < _OUTLIER_CEILING and p <= threshold]
     else:
-        med = statistics.median([e["price"] for e in entries])
-        threshold = med * 0.2
-        return [e for e in entries if e["price"] >= threshold]
+        threshold = _median_of_sorted(sorted(prices)) * 0.2
+        return [e for e, p in zip(entries, prices) if p >= threshold]
 
 
 @tool(
@@ -145,6 +167,7 @@ def _filter_outliers(
         Param("time_scale", "string", "Live history granularity. Default: hourly.", enum=["hourly", "daily"]),
         Param("granularity", "string", "Local history aggregation. Default: daily.", enum=["hourly", "daily", "weekly", "monthly"]),
         Param("raw", "boolean", "When mode='history' and source is local, return raw records. Default: false."),
+        Param("summary", "boolean", "Compute the price summary. Set false when only the records are needed. Default: true."),
         limit_param(description="Max local raw records. Default: 1000. Only applies when raw=true."),
     ],
     annotations=READ_ONLY_OPEN_WORLD,
@@ -171,7 +194,8 @@ async def _market_snapshot(args: dict[str, Any]) -> dict[str, Any]:
         force_refresh=True,
     )
 
-    summary = _summarize_prices(result.get("data", []))
+    data = result.get("data", [])
+    summary = _summarize_prices(data) if args.get("summary", True) else {"records": len(data)}
     payload: dict[str, Any] = {
         "item": {"query": item_query, "id": item},
         "mode": "snapshot",
@@ -180,8 +204,8 @@ async def _market_snapshot(args: dict[str, Any]) -> dict[str, Any]:
         "quality": quality,
         "timeframe": {"start": None, "end": None, "time_scale": None, "granularity": None},
         "summary": summary,
-        "data": result.get("data", []),
-        "record_count": len(result.get("data", [])),
+        "data": data,
+        "record_count": len(data),
         "freshness": result.get("freshness"),
         "region": result.get("region"),
         "fetched_at": result.get("fetched_at"),
@@ -205,10 +229,11 @@ async def _market_history(
     granularity = args.get("granularity", "daily")
     use_raw = args.get("raw", False)
     limit = args.get("limit", 1000)
+    include_summary = args.get("summary", True)
 
     if source in {"auto", "local"}:
-        local_status = history_db.get_status()
-        if local_status.total_records > 0:
+        # A LIMIT 1 probe rather than get_status(), which scans the whole table.
+        if history_db.has_records():
             local_data = _market_history_local_data(
                 item_id=item,
                 locations=cities,
@@ -233,6 +258,7 @@ async def _market_history(
                     data=local_data,
                     source_requested=source,
                     source_resolved="local_duckdb",
+                    include_summary=include_summary,
                 )
                 return attach_smart_resolution(local_payload, resolution_note)
         elif source == "local":
@@ -268,6 +294,7 @@ async def _market_history(
         data=live_result.get("data", []),
         source_requested=source,
         source_resolved="live_aodp_history",
+        include_summary=include_summary,
     )
     live_payload["region"] = live_result.get("region")
     live_payload["fetched_at"] = live_result.get("fetched_at")
@@ -318,6 +345,7 @@ def _market_history_payload(
     data: list[dict[str, Any]],
     source_requested: str,
     source_resolved: str,
+    include_summary: bool = True,
 ) -> dict[str, Any]:
     payload: dict[str, Any] = {
         "item": {"query": item_query, "id": item_id},
@@ -332,7 +360,7 @@ def _market_history_payload(
             "granularity": granularity,
         },
         "raw": use_raw,
-        "summary": _summarize_history(data),
+        "summary": _summarize_history(data) if include_summary else {"records": len(data)},
         "data": data,
         "record_count": len(data),
     }
@@ -343,64 +371,72 @@ def _summarize_history(data: list[dict[str, Any]]) -> dict[str, Any]:
     if not data:
         return {"records": 0}
 
-    def _first_present(entry: dict[str, Any], keys: list[str]) -> Any:
-        for key in keys:
-            value = entry.get(key)
-            if value is not None:
-                return value
-        return None
-
-    sell_points: list[dict[str, Any]] = []
-    buy_points: list[dict[str, Any]] = []
+    # Single pass: track extremes and best points as we go; only the sell
+    # prices are kept, since the median needs all of them.
     primary_prices: list[float] = []
-    timeline: list[str] = []
+    best_sell: tuple[float, Any, Any] | None = None
+    best_buy: tuple[float, Any, Any] | None = None
+    earliest: str | None = None
+    latest: str | None = None
     locations: set[str] = set()
 
     for entry in data:
-        ts = _first_present(entry, ["timestamp", "period"])
+        get = entry.get
+        ts = get("timestamp")
+        if ts is None:
+            ts = get("period")
         if isinstance(ts, str) and ts:
-            timeline.append(ts)
-        location = entry.get("location")
+            if latest is None or ts > latest:
+                latest = ts
+            if earliest is None or ts < earliest:
+                earliest = ts
+        location = get("location")
         if isinstance(location, str) and location:
             locations.add(location)
 
-        sell_price = _first_present(entry, ["avg_sell_min", "sell_price_min", "avg_price"])
+        sell_price = get("avg_sell_min")
+        if sell_price is None:
+            sell_price = get("sell_price_min")
+            if sell_price is None:
+                sell_price = get("avg_price")
         if isinstance(sell_price, (int, float)):
-            primary_prices.append(float(sell_price))
-            sell_points.append(
-                {"price": float(sell_price), "location": location, "time": ts}
-            )
-
-        buy_price = _first_present(entry, ["avg_buy_max", "buy_price_max"])
+            price = float(sell_price)
+            primary_prices.append(price)
+            if best_sell is None or price < best_sell[0]:
+                best_sell = (price, location, ts)
+
+        buy_price = get("avg_buy_max")
+        if buy_price is None:
+            buy_price = get("buy_price_max")
         if isinstance(buy_price, (int, float)):
-            buy_points.append(
-                {"price": float(buy_price), "location": location, "time": ts}
-            )
+            price = float(buy_price)
+            if best_buy is None or price > best_buy[0]:
+                best_buy = (price, location, ts)
 
     summary: dict[str, Any] = {
         "records": len(data),
         "locations_count": len(locations),
     }
-    if timeline:
-        summary["latest_time"] = max(timeline)
-        summary["earliest_time"] = min(timeline)
+    if latest is not None:
+        summary["latest_time"] = latest
+        summary["earliest_time"] = earliest
     if primary_prices:
-        summary["price_min"] = int(min(primary_prices))
-        summary["price_max"] = int(max(primary_prices))
-        summary["price_median"] = int(statistics.median(primary_prices))
-    if sell_points:
-        best_sell = min(sell_points, key=lambda x: x["price"])
+        # One in-place sort yields min, max and median without extra copies.
+        primary_prices.sort()
+        summary["price_min"] = int(primary_prices[0])
+        summary["price_max"] = int(primary_prices[-1])
+        summary["price_median"] = int(_median_of_sorted(primary_prices))
+    if best_sell is not None:
         summary["best_sell"] = {
-            "price": int(best_sell["price"]),
-            "location": best_sell["location"],
-            "time": best_sell["time"],
+            "price": int(best_sell[0]),
+            "location": best_sell[1],
+            "time": best_sell[2],
         }
-    if buy_points:
-        best_buy = max(buy_points, key=lambda x: x["price"])
+    if best_buy is not None:
         summary["best_buy"] = {
-            "price": int(best_buy["price"]),
-            "location": best_buy["location"],
-            "time": best_buy["time"],
+            "price": int(best_buy[0]),
+            "location": best_buy[1],
+            "time": best_buy[2],
         }
     return summary
 
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
+import functools
 import logging
 import os
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
-_SENSITIVE_KEYS = {
+_SENSITIVE_KEYS = frozenset({
     "api_key",
     "apikey",
     "authorization",
@@ -21,15 +22,22 @@ _SENSITIVE_KEYS = {
     "secret",
     "secret_key",
     "password",
-}
-_SAFE_TOKEN_KEY_SUFFIXES = {
+})
+_SENSITIVE_KEY_SUFFIXES = ("_token",)
+_SAFE_TOKEN_KEY_SUFFIXES = frozenset({
     "max_tokens",
     "prompt_tokens",
     "completion_tokens",
     "total_tokens",
     "input_tokens",
     "output_tokens",
-}
+})
+# Scalar values that never need sanitizing (bool is covered by int).
+_LEAF_TYPES = (str, int, float, type(None))
+# Stand-in for a container that (directly or indirectly) contains itself.
+_CYCLE_PLACEHOLDER = "[CYCLE]"
+# Stack marker: leaving a container, so it is no longer on the current path.
+_EXIT = object()
 
 
 def _env_bool(name: str, default: bool) -> bool:
@@ -39,30 +47,83 @@ def _env_bool(name: str, default: bool) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
+@functools.lru_cache(maxsize=4096)
+def _is_sensitive_key(key_text: str) -> bool:
+    """Classify a payload key; memoized since traces reuse the same key names."""
+    lowered = key_text.lower()
+    return lowered in _SENSITIVE_KEYS or (
+        lowered.endswith(_SENSITIVE_KEY_SUFFIXES) and lowered not in _SAFE_TOKEN_KEY_SUFFIXES
+    )
+
+
 def _sanitize_mapping(value: Any) -> Any:
-    if isinstance(value, dict):
-        sanitized: dict[str, Any] = {}
-        for key, item in value.items():
-            key_text = str(key)
-            lowered = key_text.lower()
-            is_sensitive = lowered in _SENSITIVE_KEYS
-            if lowered.endswith("_token") and lowered not in _SAFE_TOKEN_KEY_SUFFIXES:
-                is_sensitive = True
-            if is_sensitive:
-                sanitized[key_text] = "[REDACTED]"
+    """Return a copy of ``value`` with sensitive keys redacted at any depth.
+
+    Nested dicts, lists and tuples are walked with an explicit stack rather
+    than recursion, so deep tool payloads cannot hit the recursion limit.
+    A container that refers back to one of its ancestors is replaced with a
+    placeholder instead of being walked again.
+    """
+    if isinstance(value, _LEAF_TYPES):
+        return value
+
+    root: list[Any] = [None]
+    # (container to write into, slot in that container, source value)
+    stack: list[tuple[Any, Any, Any]] = [(root, 0, value)]
+    # Tuples are filled as lists first and frozen once all children are written.
+    pending_tuples: list[tuple[Any, Any, list[Any]]] = []
+
+    # ids of the containers between the root and the item being visited.
+    on_path: set[int] = set()
+
+    while stack:
+        target, slot, item = stack.pop()
+        if target is _EXIT:
+            on_path.discard(slot)
+            continue
+        if isinstance(item, (dict, list, tuple)):
+            item_id = id(item)
+            if item_id in on_path:
+                target[slot] = _CYCLE_PLACEHOLDER
                 continue
-            sanitized[key_text] = _sanitize_mapping(item)
-        return sanitized
-    if isinstance(value, list):
-        return [_sanitize_mapping(item) for item in value]
-    if isinstance(value, tuple):
-        return tuple(_sanitize_mapping(item) for item in value)
-    return value
+            on_path.add(item_id)
+            # Popped only after every child pushed below has been visited.
+            stack.append((_EXIT, item_id, None))
+        if isinstance(item, dict):
+            sanitized: dict[str, Any] = {}
+            target[slot] = sanitized
+            for key, child in item.items():
+                key_text = str(key)
+                if _is_sensitive_key(key_text):
+                    sanitized[key_text] = "[REDACTED]"
+                elif isinstance(child, _LEAF_TYPES):
+                    sanitized[key_text] = child
+                else:
+                    sanitized[key_text] = None  # keeps key order; filled from the stack
+                    stack.append((sanitized, key_text, child))
+        elif isinstance(item, (list, tuple)):
+            items = list(item)
+            target[slot] = items
+            if isinstance(item, tuple):
+                pending_tuples.append((target, slot, items))
+            for index, child in enumerate(items):
+                if not isinstance(child, _LEAF_TYPES):
+                    stack.append((items, index, child))
+        else:
+            target[slot] = item
+
+    # Children are discovered after their parents, so freeze innermost first.
+    for target, slot, items in reversed(pending_tuples):
+        target[slot] = tuple(items)
+    return root[0]
 
 
 def _safe_usage_details(raw: Any) -> dict[str, int] | None:
     if not isinstance(raw, dict):
         return None
+    # Provider usage is almost always already str -> int; skip per-value coercion.
+    if all(type(key) is str and type(value) is int for key, value in raw.items()):
+        return dict(raw) or None
     usage: dict[str, int] = {}
     for key, value in raw.items():
         try:
@@ -112,12 +173,20 @@ class LangfuseTracer:
     def __init__(self, config: LangfuseConfig | None = None) -> None:
         self._config = config or LangfuseConfig.from_env()
         self._client: Any | None = None
-        self._initialize()
+        # The SDK import is deferred until tracing is first needed.
+        self._initialized = False
 
     @property
     def enabled(self) -> bool:
+        self._ensure_initialized()
         return self._client is not None
 
+    def _ensure_initialized(self) -> None:
+        if self._initialized:
+            return
+        self._initialized = True
+        self._initialize()
+
     def _initialize(self) -> None:
         if not self._config.enabled:
             return
@@ -169,6 +238,7 @@ class LangfuseTracer:
         model_parameters: dict[str, Any] | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> AbstractContextManager[Any]:
+        self._ensure_initialized()
         if not self._client:
             return nullcontext(None)
 
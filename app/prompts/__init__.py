@@ -1,5 +1,17 @@
 """Prompts module - JIT Prompt Assembly System."""
 
-from .assembler import AssembledPrompt, PromptAssembler, PromptLayer, default_assembler
+from .assembler import (
+    AssembledPrompt,
+    PromptAssembler,
+    PromptLayer,
+    default_assembler,
+    render_cache_info,
+)
 
-__all__ = ["AssembledPrompt", "PromptAssembler", "PromptLayer", "default_assembler"]
+__all__ = [
+    "AssembledPrompt",
+    "PromptAssembler",
+    "PromptLayer",
+    "default_assembler",
+    "render_cache_info",
+]
@@ -1,10 +1,10 @@
 """JIT (Just-In-Time) Prompt Assembly System.
 
 Implements the State-Reflective workflow using structured schemas:
-1. RE-READ mutable files on each request (no stale cache)
+1. RE-READ prompt files whenever they change on disk (no stale cache)
 2. Parse YAML frontmatter for metadata (priority, output_contract, etc.)
 3. Assemble layered prompts in priority order (identity first)
-4. Support self-modification by always re-reading mutable files
+4. Support self-modification by keying the cache on file mtime and size
 
 Prompt Layers (assembly order — identity first, tools last):
 1. SOUL.md (100): Core personality — WHO the agent is
@@ -24,14 +24,16 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import logging
+import operator
 import re
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from app.core.schema import PromptDocument, PromptMeta, PromptType
+from app.core.schema import PromptDocument, PromptMeta
 from app.core.schema.prompt_schema import OutputContract
 
 logger = logging.getLogger(__name__)
@@ -39,8 +41,28 @@ logger = logging.getLogger(__name__)
 # Default prompts directory (relative to this file)
 DEFAULT_PROMPTS_DIR = Path(__file__).parent
 
-# Files that are mutable by the agent (always re-read, never cached)
-MUTABLE_TYPES = {PromptType.SOUL, PromptType.MEMORY, PromptType.SKILLS, PromptType.USER, PromptType.CONFIG}
+# Distinct tool lists (e.g. public vs admin) whose rendered menu is kept
+_TOOLS_MENU_CACHE_SIZE = 16
+
+_TOOL_PROTOCOL_HEADER = """\
+## Tool Protocol
+
+To call a tool, respond with ONLY this JSON — nothing else:
+{"tool": "tool_name", "arguments": {"param": "value"}}
+
+Rules:
+- ONE tool call per response. Never multiple.
+- No text, markdown, or explanation alongside a tool call.
+- Never echo or repeat tool results as JSON.
+- After receiving a result, either call another tool or give your final answer in plain text.
+- Use exact parameter names from the schemas below.
+- NEVER fill in optional parameters the user didn't specify — omitting them gives broader, more useful results. Guessing defaults narrows the search and causes missed data.
+"""
+_PRIORITY_KEY = operator.attrgetter("priority")
+_REQUIRED_MARKER = " *(required)*"
+_OPTIONAL_MARKER = " *(optional — omit if not specified by user)*"
+
+# Template markers that do not count as content, stripped in this order
 _EMPTY_CONTENT_PATTERNS = (
     re.compile(r"<!--.*?-->", re.DOTALL),
     re.compile(r"</?[^>\n]+>"),
@@ -52,14 +74,17 @@ _EMPTY_CONTENT_PATTERNS = (
     re.compile(r"---"),
 )
 
-_PLACEHOLDER_VALUES = {
+# Every placeholder is parenthesized, which lets most values skip normalization.
+_PLACEHOLDER_VALUES = frozenset({
     "(not set)",
     "(no facts recorded yet)",
     "(no sessions recorded yet)",
     "(no active context)",
     "(no skills learned yet)",
     "(no skills)",
-}
+})
+
+_COMMENT_PATTERN = _EMPTY_CONTENT_PATTERNS[0]
 
 # Regex to match <slot ...>...<value>...</value>...</slot> blocks
 _SLOT_PATTERN = re.compile(
@@ -67,8 +92,12 @@ _SLOT_PATTERN = re.compile(
     r"<value>(?P<value>.*?)</value>\s*</slot>",
     re.DOTALL,
 )
+_BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
 
 
+# Mutable layers are re-read every request but rarely change, so identical
+# content is rendered once.
+@functools.lru_cache(maxsize=64)
 def _render_natural(content: str) -> str:
     """Convert XML slot structures to natural markdown prose.
 
@@ -76,10 +105,12 @@ def _render_natural(content: str) -> str:
     - Simple text values become ``- **Label**: value`` bullets.
     - ``<entry timestamp="...">`` elements become timestamped list items.
     - ``<skill>`` elements become titled numbered-step blocks.
+    - HTML comments are removed.
     - Content without XML slots passes through unchanged.
     """
     # Strip HTML comments first
-    content = re.sub(r"<!--.*?-->", "", content, flags=re.DOTALL)
+    if "<!--" in content:
+        content = _COMMENT_PATTERN.sub("", content)
 
     def _replace_slot(match: re.Match[str]) -> str:
         slot_id = match.group("id")
@@ -87,21 +118,36 @@ def _render_natural(content: str) -> str:
         raw_value = match.group("value").strip()
 
         # Drop empty / placeholder slots
-        normalised = re.sub(r"\s+", " ", raw_value.lower())
-        if not raw_value or normalised in _PLACEHOLDER_VALUES:
+        if not raw_value or (
+            raw_value[0] == "(" and " ".join(raw_value.lower().split()) in _PLACEHOLDER_VALUES
+        ):
             return ""
 
+        # Without markup there is nothing structured to find; skip the parser.
+        if "<" not in raw_value:
+            label = _slot_label(hint)
+            return f"- **{label}**: {raw_value}"
+
         # --- Attempt structured XML parsing ---
-        # Wrap in a root so ET can parse fragments
+        # Wrap in a root so ET can parse fragments; expat consumes UTF-8 bytes
+        # directly, so build the payload as bytes rather than an f-string.
         try:
-            root = ET.fromstring(f"<root>{raw_value}</root>")
+            root = ET.fromstring(b"<root>" + raw_value.encode("utf-8", "replace") + b"</root>")
         except ET.ParseError:
             # Plain text value — render as a bullet
             label = _slot_label(hint)
             return f"- **{label}**: {raw_value}"
 
+        # Bucket the children in one pass instead of a findall() per tag.
+        entries: list[ET.Element] = []
+        skills: list[ET.Element] = []
+        for child in root:
+            if child.tag == "entry":
+                entries.append(child)
+            elif child.tag == "skill":
+                skills.append(child)
+
         # Check for <entry> children (memory-style)
-        entries = root.findall("entry")
         if entries:
             label = _slot_label(hint)
             lines = [f"**{label}**:"]
@@ -112,7 +158,6 @@ def _render_natural(content: str) -> str:
             return "\n".join(lines)
 
         # Check for <skill> children (skills-style)
-        skills = root.findall("skill")
         if skills:
             blocks: list[str] = []
             for skill in skills:
@@ -140,8 +185,7 @@ def _render_natural(content: str) -> str:
 
     result = _SLOT_PATTERN.sub(_replace_slot, content)
     # Collapse excessive blank lines left behind by removed slots
-    result = re.sub(r"\n{3,}", "\n\n", result)
-    return result
+    return _BLANK_LINES_PATTERN.sub("\n\n", result)
 
 
 def _slot_label(hint: str) -> str:
@@ -151,11 +195,10 @@ def _slot_label(hint: str) -> str:
 
 def _el_text(parent: ET.Element, tag: str) -> str:
     """Safely extract text from a child element."""
-    el = parent.find(tag)
-    return (el.text or "").strip() if el is not None else ""
+    return (parent.findtext(tag) or "").strip()
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptLayer:
     """A single prompt layer with its content and metadata."""
 
@@ -173,7 +216,7 @@ class PromptLayer:
         return bool(self.content.strip())
 
 
-@dataclass
+@dataclass(slots=True)
 class AssembledPrompt:
     """Result of prompt assembly with metadata."""
 
@@ -194,13 +237,16 @@ class PromptAssembler:
     Implements the State-Reflective workflow with structured schemas:
     1. Parse YAML frontmatter for metadata
     2. Order layers by priority (higher = loaded later)
-    3. Always RE-READ mutable files (SOUL, MEMORY, etc.)
-    4. Cache read-only files (tasks/*) for performance
+    3. Cache parsed files keyed on (mtime_ns, size), so edits to mutable
+       files (SOUL, MEMORY, etc.) are picked up on the next request
     """
 
     def __init__(self, prompts_dir: Path | None = None) -> None:
         self.prompts_dir = prompts_dir or DEFAULT_PROMPTS_DIR
-        self._cache: dict[str, PromptDocument] = {}
+        # path -> (document, st_mtime_ns, st_size) at the time it was parsed
+        self._cache: dict[str, tuple[PromptDocument, int, int]] = {}
+        # signature -> (tools the menu was built from, rendered menu)
+        self._tools_menu_cache: dict[tuple[Any, ...], tuple[list[dict[str, Any]], str]] = {}
 
     def _load_file(
         self,
@@ -209,7 +255,8 @@ class PromptAssembler:
     ) -> PromptLayer:
         """Load a prompt file from the prompts directory.
 
-        Automatically parses YAML frontmatter and caches immutable files.
+        Automatically parses YAML frontmatter. Parsed files are cached and
+        re-parsed only when their modification time or size changes.
 
         Args:
             relative_path: Path relative to prompts directory
@@ -218,67 +265,66 @@ class PromptAssembler:
         file_path = self.prompts_dir / relative_path
         cache_key = str(file_path)
 
-        # Try cache first for immutable files
-        if cache_key in self._cache:
-            doc = self._cache[cache_key]
-            return PromptLayer(
-                name=relative_path,
-                content=doc.content,
-                source=doc.source,
-                meta=doc.meta,
-            )
-
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            self._cache.pop(cache_key, None)
             if required:
-                raise FileNotFoundError(f"Required prompt file not found: {file_path}")
+                raise FileNotFoundError(f"Required prompt file not found: {file_path}") from None
             logger.debug("Optional prompt file not found: %s", file_path)
             return PromptLayer(name=relative_path, content="")
 
-        try:
-            doc = PromptDocument.from_file(file_path)
-
-            # Only cache immutable files
-            if doc.meta.type not in MUTABLE_TYPES:
-                self._cache[cache_key] = doc
-
-            return PromptLayer(
-                name=relative_path,
-                content=doc.content,
-                source=doc.source,
-                meta=doc.meta,
-            )
-        except Exception as exc:
-            logger.error("Failed to load prompt file %s: %s", file_path, exc)
-            if required:
-                raise
-            return PromptLayer(name=relative_path, content="")
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[1] == stat.st_mtime_ns and cached[2] == stat.st_size:
+            doc = cached[0]
+        else:
+            try:
+                doc = PromptDocument.from_file(file_path)
+            except Exception as exc:
+                logger.error("Failed to load prompt file %s: %s", file_path, exc)
+                if required:
+                    raise
+                return PromptLayer(name=relative_path, content="")
+            self._cache[cache_key] = (doc, stat.st_mtime_ns, stat.st_size)
+
+        return PromptLayer(
+            name=relative_path,
+            content=doc.content,
+            source=doc.source,
+            meta=doc.meta,
+        )
 
     def _format_tools_menu(self, tools: list[dict[str, Any]]) -> str:
-        """Format available tools as a menu for the system prompt."""
+        """Format available tools as a menu for the system prompt.
+
+        The registry hands out the same schema objects on every listing, so the
+        menu is memoized on (name, description, schema identity). The cached
+        entry keeps those schemas alive, which keeps their ids from being reused.
+        """
         if not tools:
             return ""
 
-        lines = [
-            "## Tool Protocol",
-            "",
-            "To call a tool, respond with ONLY this JSON — nothing else:",
-            '{"tool": "tool_name", "arguments": {"param": "value"}}',
-            "",
-            "Rules:",
-            "- ONE tool call per response. Never multiple.",
-            "- No text, markdown, or explanation alongside a tool call.",
-            "- Never echo or repeat tool results as JSON.",
-            "- After receiving a result, either call another tool or give your final answer in plain text.",
-            "- Use exact parameter names from the schemas below.",
-            "- NEVER fill in optional parameters the user didn't specify — omitting them gives broader, more useful results. Guessing defaults narrows the search and causes missed data.",
-            "",
-        ]
+        signature = tuple(
+            (tool.get("name"), tool.get("description"), id(tool.get("inputSchema")))
+            for tool in tools
+        )
+        cached = self._tools_menu_cache.get(signature)
+        if cached is not None:
+            return cached[1]
+
+        menu = self._build_tools_menu(tools)
+        if len(self._tools_menu_cache) >= _TOOLS_MENU_CACHE_SIZE:
+            self._tools_menu_cache.clear()
+        self._tools_menu_cache[signature] = (list(tools), menu)
+        return menu
+
+    @staticmethod
+    def _build_tools_menu(tools: list[dict[str, Any]]) -> str:
+        parts = [_TOOL_PROTOCOL_HEADER]
         for tool in tools:
             name = tool.get("name", "unknown")
             description = tool.get("description", "No description")
-            lines.append(f"### `{name}`")
-            lines.append(f"{description}")
-            lines.append("")
+            parts.append(f"\n### `{name}`\n{description}\n")
 
             # Add input schema summary if available
             schema = tool.get("inputSchema", {})
@@ -286,15 +332,16 @@ class PromptAssembler:
             required = set(schema.get("required", []))
 
             if properties:
-                lines.append("**Parameters:**")
-                for prop_name, prop_def in properties.items():
-                    prop_type = prop_def.get("type", "any")
-                    prop_desc = prop_def.get("description", "")
-                    req_marker = " *(required)*" if prop_name in required else " *(optional — omit if not specified by user)*"
-                    lines.append(f"- `{prop_name}` ({prop_type}){req_marker}: {prop_desc}")
-                lines.append("")
+                parts.append("\n**Parameters:**")
+                parts.extend(
+                    f"\n- `{prop_name}` ({prop_def.get('type', 'any')})"
+                    f"{_REQUIRED_MARKER if prop_name in required else _OPTIONAL_MARKER}: "
+                    f"{prop_def.get('description', '')}"
+                    for prop_name, prop_def in properties.items()
+                )
+                parts.append("\n")
 
-        return "\n".join(lines)
+        return "".join(parts)
 
     def assemble(
         self,
@@ -365,27 +412,30 @@ class PromptAssembler:
                 if task_layer.meta:
                     output_contract = task_layer.meta.output_contract
 
-        # Sort layers by priority — highest first (identity before rules)
-        layers.sort(key=lambda l: l.priority, reverse=True)
-
-        # Build sections from sorted layers (render XML to natural prose)
-        sections: list[str] = []
-        for layer in layers:
-            rendered = _render_natural(layer.content)
-            if rendered.strip():
-                if sections:
-                    sections.append("")  # blank line between layers
-                sections.append(rendered)
+        # Sort layers by priority — highest first (identity before rules).
+        # Frontmatter can override priorities, so insertion order alone is not
+        # enough; on the usual already-ordered input this is a single pass.
+        layers.sort(key=_PRIORITY_KEY, reverse=True)
+
+        # Build sections from sorted layers (render XML to natural prose),
+        # keeping only layers that render to something
+        sections = [
+            rendered
+            for rendered in (_render_natural(layer.content) for layer in layers)
+            if rendered.strip()
+        ]
 
         # 7. Operational Layer - Tools menu (always last)
         tool_list = tools or []
         if tool_list:
-            sections.append("")  # blank line before tools
             sections.append(self._format_tools_menu(tool_list))
             layers_used.append("tools")
 
+        # Blank line between sections
+        system_prompt = "\n\n".join(sections).strip()
+
         return AssembledPrompt(
-            system_prompt="\n".join(sections).strip(),
+            system_prompt=system_prompt,
             layers_used=layers_used,
             task=task,
             tool_count=len(tool_list),
@@ -399,9 +449,20 @@ class PromptAssembler:
             cleaned = pattern.sub("", cleaned)
         return not cleaned.strip()
 
+    def warm(self) -> None:
+        """Pre-load prompt files and renderings ahead of the first request."""
+        tasks_dir = self.prompts_dir / "tasks"
+        if tasks_dir.is_dir():
+            for task_file in tasks_dir.glob("*.md"):
+                self._load_file(f"tasks/{task_file.name}")
+        # Loads the core layers and populates the rendering cache.
+        self.assemble(tools=[])
+
     def clear_cache(self) -> None:
         """Clear the prompt file cache."""
         self._cache.clear()
+        self._tools_menu_cache.clear()
+        _render_natural.cache_clear()
 
     def reload(self) -> None:
         """Reload all cached prompt files."""
@@ -410,3 +471,14 @@ class PromptAssembler:
 
 # Singleton instance for easy access
 default_assembler = PromptAssembler()
+
+
+def render_cache_info() -> dict[str, int]:
+    """Return hit/miss counters of the rendered-layer cache."""
+    info = _render_natural.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize or 0,
+    }
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -12,6 +14,7 @@ from app.application import ChatMessage, ChatRequest
 from app.bootstrap import get_container
 from app.llm.provider_factory import ProviderFactory
 from app.mcp.router import mcp_router
+from app.prompts import default_assembler
 from app.web.routers import (
     chat_router,
     database_router,
@@ -26,9 +29,20 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(level
 container = get_container()
 
 _cors_origins_raw = os.getenv("CORS_ALLOWED_ORIGINS", "http://localhost:5173")
-_cors_origins = [o.strip() for o in _cors_origins_raw.split(",") if o.strip()]
+_cors_origins = tuple(filter(None, (o.strip() for o in _cors_origins_raw.split(","))))
 
-app = FastAPI(title="Albion Helper V3")
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Pay prompt file loading/parsing at startup rather than on the first chat.
+    try:
+        default_assembler.warm()
+    except Exception as exc:
+        logger.warning("Prompt cache warm-up failed: %s", exc)
+    yield
+
+
+app = FastAPI(title="Albion Helper V3", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=_cors_origins,
@@ -6,7 +6,7 @@ import logging
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.bootstrap import get_container
 
@@ -14,18 +14,31 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Handlers stay ``async`` even though they call synchronous DuckDB code:
+# HistoryDatabase shares one unlocked connection, so they must not run in
+# FastAPI's threadpool alongside event-loop handlers.
+
 
 class DbUpdateRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     max_dumps: int = Field(default=1, description="Maximum dumps to process")
 
 
 class DbResetRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     cleanup_dumps: bool = Field(
         default=True,
         description="Whether to remove downloaded dump files after reset",
     )
 
 
+# Shared defaults for body-less requests; the models are frozen so sharing is safe.
+_DEFAULT_DB_UPDATE = DbUpdateRequest()
+_DEFAULT_DB_RESET = DbResetRequest()
+
+
 @router.get("/db/status")
 async def get_db_status(check_updates: bool = False) -> dict[str, Any]:
     return await get_container().market.get_db_status(check_updates=check_updates)
@@ -33,7 +46,7 @@ async def get_db_status(check_updates: bool = False) -> dict[str, Any]:
 
 @router.post("/db/update")
 async def trigger_db_update(request: DbUpdateRequest | None = None) -> dict[str, Any]:
-    req = request or DbUpdateRequest()
+    req = request or _DEFAULT_DB_UPDATE
     try:
         return await get_container().market.update_db(max_dumps=req.max_dumps)
     except RuntimeError as exc:
@@ -45,7 +58,7 @@ async def trigger_db_update(request: DbUpdateRequest | None = None) -> dict[str,
 
 @router.post("/db/update/start")
 async def start_db_update(request: DbUpdateRequest | None = None) -> dict[str, Any]:
-    req = request or DbUpdateRequest()
+    req = request or _DEFAULT_DB_UPDATE
     try:
         return get_container().market.start_db_update(max_dumps=req.max_dumps)
     except Exception as exc:
@@ -71,7 +84,7 @@ async def clear_db_update_progress() -> dict[str, Any]:
 
 @router.post("/db/reset")
 async def reset_database(request: DbResetRequest | None = None) -> dict[str, Any]:
-    req = request or DbResetRequest()
+    req = request or _DEFAULT_DB_RESET
     try:
         return get_container().market.reset_db(cleanup_dumps=req.cleanup_dumps)
     except Exception as exc:
@@ -5,6 +5,7 @@ from __future__ import annotations
 from fastapi import APIRouter
 
 from app.llm.provider_factory import ProviderFactory
+from app.prompts import render_cache_info
 
 router = APIRouter()
 
@@ -22,3 +23,8 @@ async def root() -> dict[str, str]:
 @router.get("/providers")
 async def list_providers() -> dict[str, list[str]]:
     return {"providers": ProviderFactory.get_supported_providers()}
+
+
+@router.get("/debug/prompt-cache")
+async def prompt_cache_stats() -> dict[str, int]:
+    return render_cache_info()
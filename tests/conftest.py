@@ -0,0 +1,13 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from app.mcp.tools import combat
+
+
+@pytest.fixture(autouse=True)
+def _clear_combat_caches():
+    """Keep memoized combat lookups from hiding patched databases across tests."""
+    combat.clear_caches()
+    yield
+    combat.clear_caches()
@@ -3,6 +3,7 @@
 import pytest
 from pathlib import Path
 from textwrap import dedent
+from unittest.mock import patch
 
 from app.core.schema import (
     PromptMeta,
@@ -138,6 +139,36 @@ class TestParseFrontmatter:
         assert "Failed to parse frontmatter" in caplog.text
         assert meta == PromptMeta()
 
+    def test_simple_frontmatter_skips_yaml(self):
+        content = dedent("""
+        ---
+        version: "1.0"
+        type: config
+        mutable: false
+        priority: 60
+        tags:
+          - settings
+          - behavior
+        ---
+        Body.
+        """).strip()
+
+        with patch("app.core.schema.prompt_schema.yaml.load") as yaml_load:
+            meta, body = _parse_frontmatter(content)
+
+        yaml_load.assert_not_called()
+        assert meta.type == PromptType.CONFIG
+        assert meta.mutable is False
+        assert meta.priority == 60
+        assert meta.tags == ["settings", "behavior"]
+        assert body == "Body."
+
+    def test_unsupported_syntax_falls_back_to_yaml(self):
+        content = "---\ntype: task\ntags: [alpha, beta]\n---\nBody."
+        meta, _ = _parse_frontmatter(content)
+        assert meta.type == PromptType.TASK
+        assert meta.tags == ["alpha", "beta"]
+
 
 class TestInferTypeFromFilename:
     """Tests for _infer_type_from_filename function."""
@@ -198,6 +229,19 @@ class TestPromptDocument:
         with pytest.raises(FileNotFoundError):
             PromptDocument.from_file(tmp_path / "nonexistent.md")
 
+    def test_from_file_returns_independent_documents(self, tmp_path):
+        file_path = tmp_path / "FRESH.md"
+        file_path.write_text("---\ntags: [a]\n---\nFirst.")
+
+        first = PromptDocument.from_file(file_path)
+        first.meta.tags.append("mutated")
+        assert PromptDocument.from_file(file_path).meta.tags == ["a"]
+
+        file_path.write_text("---\npriority: 20\n---\nSecond!")
+        second = PromptDocument.from_file(file_path)
+        assert second.meta.priority == 20
+        assert second.content == "Second!"
+
     def test_from_file_success(self, tmp_path):
         file_path = tmp_path / "TEST_SOUL.md"
         file_path.write_text(dedent("""
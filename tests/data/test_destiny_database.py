@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from app.data.destiny_database import DestinyDatabase
+from app.data.destiny_database import DestinyDatabase, DestinyNode, FameLevel
 
 DATA_DIR = Path("docs/ao-bin-dumps")
 
@@ -79,6 +79,48 @@ def test_fame_to_level_mid_range(destiny_db: DestinyDatabase):
     assert result["level_count"] == 20
 
 
+def test_fame_to_level_window_sums_without_game_files():
+    db = DestinyDatabase(data_dir=DATA_DIR)
+    db._loaded = True
+    levels = [FameLevel(level=i, fame_required=i * 100, lp_cost=i) for i in range(1, 11)]
+    db._nodes["TEST_NODE"] = DestinyNode(node_id="TEST_NODE", levels=levels, total_levels=10)
+
+    result = db.get_fame_to_level("TEST_NODE", 3, 6)
+    assert result["level_count"] == 3
+    assert result["total_fame_required"] == 400 + 500 + 600
+    assert result["total_lp_cost"] == 4 + 5 + 6
+    assert [lvl["level"] for lvl in result["levels"]] == [4, 5, 6]
+
+    empty = db.get_fame_to_level("TEST_NODE", 8, 2)
+    assert empty["level_count"] == 0
+    assert empty["total_fame_required"] == 0
+
+
+def test_get_destiny_node_index_without_game_files():
+    db = DestinyDatabase(data_dir=DATA_DIR)
+    db._loaded = True
+    node = DestinyNode(node_id="COMBAT_AXES")
+    db._nodes[node.node_id] = node
+    db._node_name_index[node.node_id.lower()] = node
+
+    assert db.get_destiny_node("COMBAT_AXES") is node
+    assert db.get_destiny_node("combat_Axes") is node
+    assert db.get_destiny_node("COMBAT_SWORDS") is None
+
+
+def test_search_destiny_nodes_index_without_game_files():
+    db = DestinyDatabase(data_dir=DATA_DIR)
+    db._loaded = True
+    for node_id, category in [("COMBAT_BOWS", "fighting"), ("GATHER_ORE", "gathering"), ("COMBAT_CROSSBOWS", "fighting")]:
+        db._nodes[node_id] = DestinyNode(node_id=node_id, category=category)
+    db._build_search_index()
+
+    assert [r["node_id"] for r in db.search_destiny_nodes(query="bow")] == ["COMBAT_BOWS", "COMBAT_CROSSBOWS"]
+    assert [r["node_id"] for r in db.search_destiny_nodes(category="gathering")] == ["GATHER_ORE"]
+    assert db.search_destiny_nodes(query="bow", category="gathering") == []
+    assert db.search_destiny_nodes(category="unknown") == []
+
+
 def test_fame_to_level_not_found(destiny_db: DestinyDatabase):
     assert destiny_db.get_fame_to_level("FAKE_NODE", 0, 50) is None
 
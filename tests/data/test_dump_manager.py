@@ -91,12 +91,14 @@ class TestDumpManager:
     def test_classify_dump_daily(self):
         manager = DumpManager()
         assert manager._classify_dump("db_backup_2026-01-15.tgz") == "daily"
+        assert manager._classify_dump("db_backup_2026-02-05T12_00_00.tgz") == "daily"
 
     def test_classify_dump_non_daily_returns_none(self):
         manager = DumpManager()
         assert manager._classify_dump("market_history_2026_01.sql.gz") is None
         assert manager._classify_dump("monthly_db_backup_2026-01.tgz") is None
         assert manager._classify_dump("random_file.txt") is None
+        assert manager._classify_dump("db_backup_latest.tgz") is None
 
     def test_get_missing_dumps(self):
         mock_db = MagicMock()
@@ -279,6 +281,15 @@ class TestDumpManager:
         assert records[1]["item_id"] == "T5_BAG"
         assert records[1]["location"] == "Bridgewatch"
 
+    def test_parse_value_tuples_reuses_repeated_strings(self):
+        manager = DumpManager()
+        line = "(1,2,100,'T4_BAG',9999,1,'2026-01-15',6),(2,3,200,'T4_BAG',9999,1,'2026-01-16',6);"
+        first, second = manager._parse_value_tuples(line)
+
+        assert first["item_id"] is second["item_id"]
+        assert first["location"] == "9999"
+        assert first["location"] is second["location"]
+
     def test_import_copy_stream(self):
         manager = DumpManager(db=MagicMock())
         manager.db.insert_records.side_effect = lambda records, batch_size=10000: len(records)
@@ -301,6 +312,12 @@ class TestDumpManager:
         assert date_start == "2026-01-15"
         assert date_end == "2026-01-16"
 
+    def test_split_copy_line_unescapes_only_when_needed(self):
+        manager = DumpManager()
+
+        assert manager._split_copy_line("1\tT4_BAG\t2026-01-15") == ["1", "T4_BAG", "2026-01-15"]
+        assert manager._split_copy_line("1\t\\N\tA\\tB\\\\") == ["1", None, "A\tB\\"]
+
 
 class TestDumpManagerAsync:
     """Async tests for DumpManager."""
@@ -334,3 +351,5 @@ class TestDumpManagerAsync:
             assert len(dumps) == 1
             assert dumps[0].name == "db_backup_2026-01-15.tgz"
             assert dumps[0].dump_type == "daily"
+            assert dumps[0].size_bytes == 123456789
+            assert dumps[0].modified_date == datetime(2026, 1, 15, 0, 0)
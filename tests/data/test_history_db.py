@@ -79,6 +79,63 @@ class TestHistoryDatabase:
         status = db.get_status()
         assert status.total_records == 2
 
+    def test_insert_records_batch_keeps_last_duplicate(self, db):
+        """Duplicate keys within a batch resolve to the last record."""
+        records = [
+            {
+                "item_id": "T4_BAG",
+                "location": 'Fort Sterling, "Portal"',
+                "timestamp": "2026-01-15T10:00:00",
+                "sell_price_min": 2500,
+            },
+            {
+                "item_id": "T4_BAG",
+                "location": 'Fort Sterling, "Portal"',
+                "quality": 1,
+                "timestamp": "2026-01-15 10:00:00",
+                "sell_price_min": 2700,
+                "item_count": None,
+            },
+        ]
+        # Pad the batch so it takes the spooled CSV path.
+        records += [
+            {"item_id": "T5_BAG", "location": "Caerleon", "timestamp": f"2026-01-1{day}"}
+            for day in range(2)
+        ]
+
+        assert db.insert_records(records) == 4
+
+        rows = db.connect().execute(
+            "SELECT location, quality, sell_price_min, item_count FROM market_history "
+            "WHERE item_id = 'T4_BAG'"
+        ).fetchall()
+        assert rows == [('Fort Sterling, "Portal"', 1, 2700, None)]
+
+    def test_insert_records_csv_batch_matches_bound_values(self, db, caplog):
+        """Spooled batches keep '' distinct from NULL and accept float prices."""
+        records = [
+            {
+                "item_id": f"T{tier}_BAG",
+                "location": "" if tier == 4 else "Lymhurst",
+                "quality": 1,
+                "timestamp": "2026-01-15T10:00:00",
+                "sell_price_min": 2500.0 * tier,
+                "buy_price_min": None,
+                "item_count": 3,
+            }
+            for tier in range(4, 9)
+        ]
+
+        assert db.insert_records(records) == 5
+
+        assert "CSV batch load failed" not in caplog.text
+        rows = db.connect().execute(
+            "SELECT item_id, location, sell_price_min, buy_price_min "
+            "FROM market_history ORDER BY item_id"
+        ).fetchall()
+        assert rows[0] == ("T4_BAG", "", 10000, None)
+        assert rows[-1] == ("T8_BAG", "Lymhurst", 20000, None)
+
     def test_query_history(self, db):
         """Test querying historical data."""
         records = [
@@ -135,6 +192,21 @@ class TestHistoryDatabase:
         assert len(results) == 1
         assert results[0]["location"] == "Caerleon"
 
+    def test_has_records(self, db):
+        """has_records flips once any market row exists."""
+        assert db.has_records() is False
+        db.insert_records([
+            {
+                "item_id": "T4_BAG",
+                "location": "Caerleon",
+                "quality": 1,
+                "timestamp": "2026-01-15T10:00:00",
+                "sell_price_min": 2500,
+                "item_count": 1,
+            },
+        ])
+        assert db.has_records() is True
+
     def test_get_aggregated_history(self, db):
         """Test aggregated history queries."""
         records = [
@@ -162,6 +234,32 @@ class TestHistoryDatabase:
         assert results[0]["avg_sell_min"] == 2550  # Average of 2500 and 2600
         assert results[0]["total_volume"] == 80  # Sum of 50 and 30
 
+    def test_get_aggregated_history_excludes_sell_outliers(self, db):
+        """Troll sell listings are dropped from the sell average in SQL."""
+        records = [
+            {
+                "item_id": "T4_BAG",
+                "location": "Caerleon",
+                "quality": 1,
+                "timestamp": f"2026-01-15T{hour:02d}:00:00",
+                "sell_price_min": price,
+                "buy_price_max": 2000,
+                "item_count": 1,
+            }
+            for hour, price in ((10, 2500), (11, 2600), (12, 2700), (13, 999_999), (14, 50_000))
+        ]
+        db.insert_records(records)
+
+        raw = db.get_aggregated_history(item_id="T4_BAG", granularity="daily")
+        filtered = db.get_aggregated_history(
+            item_id="T4_BAG", granularity="daily", exclude_outliers=True
+        )
+
+        assert raw[0]["avg_sell_min"] > 100_000
+        assert filtered[0]["avg_sell_min"] == 2600
+        assert filtered[0]["avg_buy_max"] == 2000
+        assert filtered[0]["data_points"] == 5
+
     def test_record_import(self, db):
         """Test recording import metadata."""
         db.record_import(
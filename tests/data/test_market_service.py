@@ -1,11 +1,18 @@
 """Tests for market service, including freshness filtering."""
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from app.data.market_service import FreshnessInfo, MarketService, _is_empty_entry
+from app.data.aodp_client import AODPError
+from app.data.market_service import (
+    FreshnessInfo,
+    MarketService,
+    _is_empty_entry,
+    _PriceRequestBatcher,
+)
 
 
 class TestFreshnessInfo:
@@ -565,3 +572,98 @@ class TestMarketServiceGetHistory:
 
                     assert len(result["data"]) == 2
                     assert result["data"][0]["avg_price"] == 2400
+
+
+class TestPriceRequestBatching:
+    """Concurrent price lookups share one AODP request."""
+
+    @staticmethod
+    def _entry(item_id: str, price: int) -> dict:
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        return {
+            "item_id": item_id,
+            "city": "Caerleon",
+            "quality": 1,
+            "sell_price_min": price,
+            "sell_price_min_date": now,
+            "sell_price_max": price,
+            "sell_price_max_date": now,
+            "buy_price_min": 0,
+            "buy_price_min_date": "0001-01-01T00:00:00",
+            "buy_price_max": 0,
+            "buy_price_max_date": "0001-01-01T00:00:00",
+        }
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_are_coalesced(self):
+        import asyncio
+        from unittest.mock import MagicMock
+
+        resolver = MagicMock()
+        resolver.resolve.side_effect = lambda name: type(
+            "Resolution", (), {"item_id": name, "strategy": "catalog", "display_name": name}
+        )()
+        cache = MagicMock()
+        cache.get.return_value = None
+
+        with patch("app.data.market_service.AODPClient") as mock_client_cls:
+            mock_client = AsyncMock()
+            mock_client.get_prices.return_value = [
+                self._entry("T4_BAG", 2500),
+                self._entry("T5_BAG", 7000),
+            ]
+            mock_client_cls.return_value.__aenter__.return_value = mock_client
+
+            service = MarketService(cache=cache, resolver=resolver, batch_window_s=0.01)
+            bag4, bag5 = await asyncio.gather(
+                service.get_prices(item="T4_BAG", cities=["Caerleon"]),
+                service.get_prices(item="T5_BAG", cities=["Caerleon"]),
+            )
+
+        mock_client.get_prices.assert_awaited_once()
+        assert mock_client.get_prices.await_args.args[0] == "T4_BAG,T5_BAG"
+        assert [row["sell_price_min"] for row in bag4["data"]] == [2500]
+        assert [row["sell_price_min"] for row in bag5["data"]] == [7000]
+
+
+class TestPriceRequestBatcher:
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried_per_item(self):
+        async def fetch(*, item_ids, cities, qualities):
+            if "BAD_ID" in item_ids:
+                raise AODPError("invalid item id")
+            return [{"item_id": item_id} for item_id in item_ids]
+
+        batcher = _PriceRequestBatcher(fetch, window_s=0.01)
+        good, bad = await asyncio.gather(
+            batcher.submit(item_id="T4_BAG", cities=["Caerleon"], qualities=None),
+            batcher.submit(item_id="BAD_ID", cities=["Caerleon"], qualities=None),
+            return_exceptions=True,
+        )
+
+        assert good == [{"item_id": "T4_BAG"}]
+        assert isinstance(bad, AODPError)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_releases_waiters(self):
+        fetch_started = asyncio.Event()
+
+        async def fetch(*, item_ids, cities, qualities):
+            fetch_started.set()
+            await asyncio.sleep(30)
+            return []
+
+        batcher = _PriceRequestBatcher(fetch, window_s=0)
+        waiter = asyncio.create_task(
+            batcher.submit(item_id="T4_BAG", cities=["Caerleon"], qualities=None)
+        )
+        await asyncio.wait_for(fetch_started.wait(), 5)
+        (flush_task,) = [
+            task for task in asyncio.all_tasks()
+            if task.get_coro().__qualname__ == "_PriceRequestBatcher._flush"
+        ]
+        flush_task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(waiter, 5)
+        assert batcher._pending == {}
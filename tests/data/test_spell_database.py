@@ -179,3 +179,10 @@ def test_dot_effect_has_interval_and_ticks(spell_db: SpellDatabase):
             break
     else:
         pytest.skip("No DoT spells found")
+
+
+def test_resolve_spell_chain_many(spell_db: SpellDatabase):
+    result = spell_db.resolve_spell_chain_many(["PASSIVE_MAXLOAD", "FAKE_SPELL_999", "PASSIVE_MAXLOAD"])
+    assert list(result) == ["PASSIVE_MAXLOAD", "FAKE_SPELL_999"]
+    assert result["PASSIVE_MAXLOAD"] == spell_db.resolve_spell_chain("PASSIVE_MAXLOAD")
+    assert result["FAKE_SPELL_999"] is None
@@ -171,3 +171,11 @@ def test_learn_skill_uses_slot_format(temp_prompts_dir, monkeypatch):
     assert '<step index="2">Compare fame efficiency by activity</step>' in skills_content
     assert "<value>(not set)</value>" not in skills_content
     assert "*Last modified:" in skills_content
+
+
+def test_add_timestamp_refreshes_every_footer():
+    content = "# Soul\n\n*Last modified: Never*\n\n## Appended\n\n*Last updated: 2020-01-01 00:00*\n"
+    updated = agent_tools_module._add_timestamp(content)
+    assert "Never" not in updated
+    assert "2020-01-01" not in updated
+    assert len(re.findall(r"\*Last modified: \d{4}-\d{2}-\d{2} \d{2}:\d{2}\*", updated)) == 2
@@ -1,10 +1,13 @@
 """Tests for the sandboxed execute_code MCP tool."""
 
 import asyncio
+import threading
+from types import SimpleNamespace
 
 import pytest
 
-from app.mcp.tools.execute_code import execute_code
+import app.mcp.tools.execute_code as execute_code_module
+from app.mcp.tools.execute_code import _SandboxPool, _pool_size_from_env, execute_code
 
 
 @pytest.fixture
@@ -32,6 +35,11 @@ class TestBasicExecution:
         assert result["success"] is True
         assert "hello world" in result["output"]
 
+    def test_print_lone_surrogate(self, run):
+        result = run("print('\\ud800')")
+        assert result["success"] is True
+        assert result["output"] == "\ud800"
+
     def test_multiline_code(self, run):
         code = "x = 10\ny = 20\nprint(x + y)"
         result = run(code)
@@ -246,6 +254,122 @@ i.price
         assert "0: 'a'" in result["result"]
 
 
+class TestOutputCap:
+    def test_runaway_output_is_truncated(self, run):
+        result = run("for _ in range(20000):\n    print('0123456789')")
+        assert result["success"] is True
+        assert result["output"].endswith("(truncated at 50000 chars)")
+        assert len(result["output"]) < 50100
+
+
+class TestBoundedReader:
+    def test_oversized_result_is_rejected(self, run):
+        result = run("'x' * 20_000_000")
+        assert result["success"] is False
+        assert "too large" in result["error"].lower()
+
+    def test_sandbox_usable_after_oversized_result(self, run):
+        run("'x' * 20_000_000")
+        result = run("sum(range(10))")
+        assert result["success"] is True
+        assert result["result"] == "45"
+
+
+class TestFastPath:
+    def test_large_power_falls_back_to_sandbox(self, run):
+        result = run("2 ** 10000")
+        assert result["success"] is True
+        assert result["result"] == str(2 ** 10000)
+
+    def test_float_overflow_reported(self, run):
+        result = run("10.0 ** 400")
+        assert result["success"] is False
+        assert "OverflowError" in result["error"]
+
+
+class TestWorkerIsolation:
+    def test_module_mutation_does_not_leak_between_calls(self, run):
+        first = run("math.pi = 3\nmath.pi")
+        assert first["result"] == "3"
+        second = run("math.pi")
+        assert second["success"] is True
+        assert second["result"].startswith("3.14")
+
+
+class TestWorkerPool:
+    def test_invalid_pool_size_falls_back_to_default(self, monkeypatch):
+        monkeypatch.setenv("EXECUTE_CODE_POOL_SIZE", "lots")
+        assert _pool_size_from_env() == 2
+        monkeypatch.setenv("EXECUTE_CODE_POOL_SIZE", "-3")
+        assert _pool_size_from_env() == 0
+
+    def test_acquire_refills_off_the_calling_thread(self, monkeypatch):
+        spawned_on: list[threading.Thread] = []
+        refilled = threading.Event()
+
+        def fake_spawn():
+            spawned_on.append(threading.current_thread())
+            refilled.set()
+            return SimpleNamespace(poll=lambda: None)
+
+        monkeypatch.setattr(execute_code_module, "_spawn_worker", fake_spawn)
+        pool = _SandboxPool(1)
+        warm = SimpleNamespace(poll=lambda: None)
+        pool._idle.append(warm)
+
+        assert pool.acquire() is warm
+        assert refilled.wait(5)
+        assert spawned_on and threading.current_thread() not in spawned_on
+
+
+class TestFastMode:
+    def test_fast_execution(self, run):
+        result = run("x = 6\nprint(x)\nx * 7", fast=True)
+        assert result["success"] is True
+        assert result["output"] == "6"
+        assert result["result"] == "42"
+
+    def test_fast_calls_get_fresh_namespace(self, run):
+        run("leftover = 1", fast=True)
+        result = run("leftover", fast=True)
+        assert result["success"] is False
+        assert "NameError" in result["error"]
+
+    def test_fast_builtins_override_does_not_carry_over(self, run):
+        run('__builtins__["len"] = lambda x: 42', fast=True)
+        result = run("len([1, 2, 3])", fast=True)
+        assert result["success"] is True
+        assert result["result"] == "3"
+
+    async def test_fast_call_does_not_wait_for_busy_worker(self):
+        busy = asyncio.create_task(execute_code({"code": "while True: pass", "timeout": 3, "fast": True}))
+        await asyncio.sleep(0.5)
+        result = await execute_code({"code": "math.factorial(4)", "fast": True})
+        assert not busy.done()
+        assert result["success"] is True
+        assert result["result"] == "24"
+        assert "timed out" in (await busy)["error"].lower()
+
+    def test_fast_output_does_not_carry_over(self, run):
+        run("for _ in range(6000):\n    print('0123456789')", fast=True)
+        result = run("x = 1\nx + 1", fast=True)
+        assert result["output"] == ""
+        assert result["result"] == "2"
+
+    def test_fast_recovers_after_error(self, run):
+        failed = run("x = 0\n1 / x", fast=True)
+        assert "ZeroDivisionError" in failed["error"]
+        result = run("math.factorial(5)", fast=True)
+        assert result["success"] is True
+        assert result["result"] == "120"
+
+    def test_fast_timeout(self, run):
+        result = run("while True: pass", timeout=1, fast=True)
+        assert result["success"] is False
+        assert "timed out" in result["error"].lower()
+        assert run("math.factorial(3)", fast=True)["result"] == "6"
+
+
 class TestTimeout:
     def test_infinite_loop_timeout(self, run):
         result = run("while True: pass", timeout=2)
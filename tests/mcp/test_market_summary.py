@@ -0,0 +1,56 @@
+"""Tests for market price summarization helpers."""
+
+from app.mcp.tools.market import _filter_outliers, _PriceEntry, _summarize_history, _summarize_prices
+
+
+def _entries(*prices):
+    return [_PriceEntry(f"City{i}", price, None) for i, price in enumerate(prices)]
+
+
+def test_filter_outliers_drops_ceiling_and_far_above_median():
+    entries = _entries(1000, 1100, 1200, 999_999, 9000)
+    kept = _filter_outliers(entries)
+    assert [e.price for e in kept] == [1000, 1100, 1200]
+
+
+def test_filter_outliers_all_ceiling_returns_empty():
+    assert _filter_outliers(_entries(999_999, 996_000)) == []
+
+
+def test_filter_outliers_low_side_for_buy_orders():
+    kept = _filter_outliers(_entries(1, 900, 1000, 1100), high_outliers=False)
+    assert [e.price for e in kept] == [900, 1000, 1100]
+
+
+def test_summarize_prices_keeps_best_per_city():
+    data = [
+        {"location": "Martlock", "sell_price_min": 1200, "buy_price_max": 900},
+        {"location": "Martlock", "sell_price_min": 1100, "buy_price_max": 950},
+        {"location": "Lymhurst", "sell_price_min": 999_999, "buy_price_max": 1},
+        {"location": "Thetford", "sell_price_min": 1300, "buy_price_max": 1000},
+    ]
+    summary = _summarize_prices(data)
+    assert summary["best_sell"]["location"] == "Martlock"
+    assert summary["best_sell"]["price"] == 1100
+    assert summary["sell_prices"] == {"Martlock": 1100, "Thetford": 1300}
+    assert summary["best_buy"]["price"] == 1000
+    assert summary["buy_prices"] == {"Martlock": 950, "Thetford": 1000}
+
+
+def test_summarize_history_median_min_max():
+    data = [
+        {"timestamp": "2024-01-01T00:00:00", "location": "Martlock", "avg_price": 100, "buy_price_max": 80},
+        {"timestamp": "2024-01-02T00:00:00", "location": "Martlock", "avg_price": 300},
+        {"timestamp": "2024-01-03T00:00:00", "location": "Thetford", "avg_price": 200, "buy_price_max": 90},
+        {"timestamp": "2024-01-04T00:00:00", "location": "Thetford", "avg_price": 401},
+    ]
+    summary = _summarize_history(data)
+    assert summary["records"] == 4
+    assert summary["locations_count"] == 2
+    assert summary["price_min"] == 100
+    assert summary["price_max"] == 401
+    assert summary["price_median"] == 250
+    assert summary["earliest_time"] == "2024-01-01T00:00:00"
+    assert summary["latest_time"] == "2024-01-04T00:00:00"
+    assert summary["best_sell"]["price"] == 100
+    assert summary["best_buy"] == {"price": 90, "location": "Thetford", "time": "2024-01-03T00:00:00"}
@@ -154,3 +154,16 @@ class TestFormatToolResult:
         assert '"data"' not in result
         assert '"summary"' in result
         assert '"best_sell"' in result
+
+    def test_result_json_handles_non_str_keys_and_wide_ints(self):
+        result = format_tool_result("get_prices", {1: "tier", "big": 2**70})
+        assert '"1": "tier"' in result
+        assert str(2**70) in result
+
+    def test_result_json_keeps_non_finite_floats(self):
+        result = format_tool_result(
+            "get_prices", {"nan": float("nan"), "rows": [{"ratio": float("inf")}], "missing": None}
+        )
+        assert '"nan": NaN' in result
+        assert '"ratio": Infinity' in result
+        assert '"missing": null' in result
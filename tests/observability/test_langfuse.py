@@ -5,7 +5,12 @@ from __future__ import annotations
 import sys
 import types
 
-from app.observability.langfuse import LangfuseConfig, LangfuseTracer
+from app.observability.langfuse import (
+    LangfuseConfig,
+    LangfuseTracer,
+    _safe_usage_details,
+    _sanitize_mapping,
+)
 
 
 class _FakeGeneration:
@@ -96,3 +101,86 @@ def test_langfuse_tracer_records_generation(monkeypatch):
     assert client.start_calls[0]["metadata"]["token"] == "[REDACTED]"
     assert client.updates[0]["usage_details"] == {"input": 10, "output": 4}
     assert client.flush_calls == 1
+
+
+def test_sanitize_mapping_redacts_nested_sensitive_keys():
+    payload = {
+        "Authorization": "Bearer abc",
+        "usage": {"max_tokens": 512, "session_token": "s3cr3t"},
+        "messages": [{"role": "user", "content": "hi", "api_key": "k"}],
+        "pair": ({"password": "p"}, 3),
+        "count": 2,
+    }
+    assert _sanitize_mapping(payload) == {
+        "Authorization": "[REDACTED]",
+        "usage": {"max_tokens": 512, "session_token": "[REDACTED]"},
+        "messages": [{"role": "user", "content": "hi", "api_key": "[REDACTED]"}],
+        "pair": ({"password": "[REDACTED]"}, 3),
+        "count": 2,
+    }
+    # The input is never modified in place.
+    assert payload["usage"]["session_token"] == "s3cr3t"
+
+
+def test_sanitize_mapping_handles_deep_nesting():
+    payload: dict[str, object] = {}
+    node = payload
+    for _ in range(5000):
+        child: dict[str, object] = {}
+        node["next"] = child
+        node = child
+    node["secret"] = "hidden"
+
+    sanitized = _sanitize_mapping(payload)
+    for _ in range(5000):
+        sanitized = sanitized["next"]
+    assert sanitized == {"secret": "[REDACTED]"}
+
+
+def test_sanitize_mapping_replaces_cycles_with_placeholder():
+    shared = ["x"]
+    payload: dict[str, object] = {"a": shared, "b": shared}
+    loop: list[object] = [1]
+    loop.append(loop)
+    payload["loop"] = loop
+    payload["self"] = payload
+
+    sanitized = _sanitize_mapping(payload)
+
+    assert sanitized["self"] == "[CYCLE]"
+    assert sanitized["loop"] == [1, "[CYCLE]"]
+    # Repeated but acyclic references are copied, not flagged.
+    assert sanitized["a"] == ["x"] and sanitized["b"] == ["x"]
+
+
+def test_langfuse_tracer_defers_sdk_construction(monkeypatch):
+    fake_module = types.ModuleType("langfuse")
+    fake_module.Langfuse = _FakeLangfuse
+    monkeypatch.setitem(sys.modules, "langfuse", fake_module)
+
+    tracer = LangfuseTracer(
+        LangfuseConfig(
+            enabled=True,
+            public_key="pk",
+            secret_key="sk",
+            base_url="https://cloud.langfuse.com",
+            environment=None,
+            release=None,
+        )
+    )
+    assert tracer._client is None
+    tracer.flush()
+    assert tracer._client is None
+
+    with tracer.start_generation(name="chat", model="x", prompt=[]) as generation:
+        assert generation is not None
+    assert isinstance(tracer._client, _FakeLangfuse)
+
+
+def test_safe_usage_details_int_fast_path_returns_copy():
+    raw = {"input": 10, "output": 4}
+    usage = _safe_usage_details(raw)
+    assert usage == raw
+    assert usage is not raw
+    assert _safe_usage_details({}) is None
+    assert _safe_usage_details({"input": True}) == {"input": 1}
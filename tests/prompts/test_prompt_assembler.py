@@ -118,13 +118,22 @@ def test_assembler_to_message(assembler):
     assert message["content"] == result.system_prompt
 
 
-def test_mutable_files_bypass_cache(assembler):
-    """Test that mutable files (SOUL, MEMORY, etc.) are not cached."""
-    result = assembler.assemble()
-    
-    # SOUL.md should not be in cache (it's mutable)
-    soul_cached = any("SOUL.md" in key for key in assembler._cache.keys())
-    assert not soul_cached, "SOUL.md should not be cached"
+def test_mutable_files_reparsed_after_change(tmp_path):
+    """Mutable files are cached but re-read once they change on disk."""
+    import os
+
+    soul = tmp_path / "SOUL.md"
+    soul.write_text("# Soul\n\nFirst version\n", encoding="utf-8")
+    assembler = PromptAssembler(prompts_dir=tmp_path)
+
+    assert "First version" in assembler.assemble().system_prompt
+    assert any("SOUL.md" in key for key in assembler._cache)
+
+    soul.write_text("# Soul\n\nSecond version!\n", encoding="utf-8")
+    stat = soul.stat()
+    os.utime(soul, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert "Second version!" in assembler.assemble().system_prompt
 
 
 def test_assembler_includes_tool_protocol_in_soul(assembler):
@@ -216,6 +225,26 @@ def test_render_natural_strips_html_comments():
     assert "Visible text." in result
 
 
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        # Comment inside the value
+        ('<slot id="a" hint="Name">\n  <value>Aldo <!-- was: Bob --></value>\n</slot>', "- **Name**: Aldo"),
+        # Comments between the slot markup and the value
+        ('<slot id="a" hint="Name"><!-- c -->\n  <value>Aldo</value>\n<!-- d --></slot>', "- **Name**: Aldo"),
+        # Comment containing a whole slot
+        ('Head\n<!-- <slot id="a" hint="Name"><value>Aldo</value></slot> -->\nTail', "Head\n\nTail"),
+        # Comment opening before a slot and closing inside it
+        ('<!-- x <slot id="a" hint="Name"><value>Aldo --></value></slot>\nTail', "</value></slot>\nTail"),
+        # Comment hiding a closing </value>
+        ('<slot id="a" hint="Name"><value>Aldo <!-- </value></slot> --> Bob</value></slot>', "- **Name**: Aldo  Bob"),
+    ],
+)
+def test_render_natural_strips_comments_before_matching_slots(content, expected):
+    """Comments are removed before slots are matched, wherever they sit."""
+    assert _render_natural(content) == expected
+
+
 def test_assembled_prompt_has_no_xml_tags(assembler):
     """End-to-end: assembled prompt must not contain XML slot tags."""
     result = assembler.assemble()
@@ -233,3 +262,66 @@ def test_soul_appears_before_config(assembler):
     assert config_pos >= 0, "CONFIG content not found"
     assert soul_pos < config_pos, f"SOUL ({soul_pos}) should appear before CONFIG ({config_pos})"
 
+
+
+def test_render_natural_reuses_rendering_until_cache_cleared(assembler):
+    from app.prompts.assembler import render_cache_info
+
+    content = '<slot id="cities" hint="Preferred cities">\n  <value>Lymhurst</value>\n</slot>'
+    assembler.clear_cache()
+    first = _render_natural(content)
+    assert _render_natural(content) is first
+    assert render_cache_info()["hits"] >= 1
+
+    assembler.clear_cache()
+    assert render_cache_info()["size"] == 0
+
+
+def test_tools_menu_is_reused_for_the_same_tool_list(assembler):
+    schema = {"type": "object", "properties": {"item": {"type": "string", "description": "Item"}}}
+
+    def listing(description="Look up an item"):
+        # Like the registry: fresh outer dicts around the same schema object.
+        return [{"name": "lookup", "description": description, "inputSchema": schema}]
+
+    first = assembler._format_tools_menu(listing())
+    assert assembler._format_tools_menu(listing()) is first
+    assert "Changed description" in assembler._format_tools_menu(listing("Changed description"))
+
+
+def test_render_natural_plain_text_slots_skip_xml_parsing():
+    """Plain-text slot values render as bullets without touching the XML parser."""
+    from unittest.mock import patch
+
+    content = '<slot id="style" hint="Play style">\n  <value>Solo & small-scale PvP</value>\n</slot>'
+    with patch("app.prompts.assembler.ET.fromstring", side_effect=AssertionError("parsed")):
+        result = _render_natural(content)
+    assert result == "- **Play style**: Solo & small-scale PvP"
+
+
+def test_is_empty_content_matches_marker_stripping(assembler):
+    empty = "# Memory\n\n<slot id=\"a\">\n<value>(not set)</value>\n</slot>\n---\n*Last updated: now*\n"
+    filled = "# Memory\n\n- **Name**: Aldo\n" + "<!-- note -->\n" * 50
+    assert assembler._is_empty_content(empty) is True
+    assert assembler._is_empty_content(filled) is False
+    assert assembler._is_empty_content(empty + "trailing text") is False
+
+
+def test_is_empty_content_strips_comments_before_other_markers(assembler):
+    assert assembler._is_empty_content("<!-- a -->\n<!-- b -->\n") is True
+    # Once the comment is gone, "<b " is no longer a tag.
+    assert assembler._is_empty_content("<b <!-- c -->") is False
+    assert assembler._is_empty_content("(not set <!-- ) -->") is False
+
+
+def test_warm_preloads_core_and_task_files(tmp_path):
+    (tmp_path / "SOUL.md").write_text("# Soul\n\nHello\n", encoding="utf-8")
+    (tmp_path / "tasks").mkdir()
+    (tmp_path / "tasks" / "trade.md").write_text("# Trade\n\nBuy low\n", encoding="utf-8")
+    assembler = PromptAssembler(prompts_dir=tmp_path)
+
+    assembler.warm()
+
+    cached = set(assembler._cache)
+    assert str(tmp_path / "SOUL.md") in cached
+    assert str(tmp_path / "tasks" / "trade.md") in cached
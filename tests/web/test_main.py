@@ -33,6 +33,12 @@ def test_providers_endpoint():
     assert set(providers) == {"ollama", "anthropic", "openai", "gemini"}
 
 
+def test_prompt_cache_endpoint():
+    response = client.get("/debug/prompt-cache")
+    assert response.status_code == 200
+    assert set(response.json()) == {"hits", "misses", "size", "max_size"}
+
+
 def test_item_labels_endpoint():
     mock_item = type(
         "ItemInfo",
@@ -106,6 +112,31 @@ def test_chat_non_streaming_anthropic_returns_text():
     mock_provider.chat.assert_awaited_once()
 
 
+def test_chat_streaming_sends_unbuffered_sse_headers():
+    async def fake_stream(*_args, **_kwargs):
+        yield {"message": {"content": "Hi"}}
+
+    mock_provider = AsyncMock()
+    mock_provider.__aenter__.return_value = mock_provider
+    mock_provider.__aexit__.return_value = None
+    mock_provider.stream_chat = fake_stream
+
+    with patch("app.web.main.ProviderFactory.create", return_value=mock_provider):
+        payload = {
+            "provider": "ollama",
+            "model": "llama3",
+            "messages": [{"role": "user", "content": "test"}],
+            "stream": True,
+        }
+        response = client.post("/chat", json=payload)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.headers["x-accel-buffering"] == "no"
+    assert '"type": "delta", "text": "Hi"' in response.text
+
+
 def test_chat_non_streaming_anthropic_reasoning_applies_thinking_and_token_reserve():
     mock_provider = AsyncMock()
     mock_provider.__aenter__.return_value = mock_provider
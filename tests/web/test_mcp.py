@@ -1,10 +1,12 @@
 """Tests for MCP tool endpoints."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 from fastapi.testclient import TestClient
 
 from app.data import MarketServiceError
+from app.mcp.tools.combat import clear_caches, spell_info
 from app.web.main import app
 
 
@@ -111,6 +113,7 @@ def test_call_item_info_includes_stats_and_effects():
         "ip_progression_type": "bag",
         "combat_spec_achievement": "COMBAT_BAGS",
         "enchantment_ips": {1: 800},
+        "enchantment_ips_with_base": {0: 700, 1: 800},
         "attack_damage": 0,
         "attack_speed": 0,
         "attack_range": 0,
@@ -174,6 +177,7 @@ def test_call_item_info_computes_max_load_progression_table():
         "ip_progression_type": "bag",
         "combat_spec_achievement": "COMBAT_BAGS",
         "enchantment_ips": {1: 800, 2: 900, 3: 1000, 4: 1100},
+        "enchantment_ips_with_base": {0: 700, 1: 800, 2: 900, 3: 1000, 4: 1100},
         "attack_damage": 0,
         "attack_speed": 0,
         "attack_range": 0,
@@ -264,6 +268,7 @@ def test_call_item_info_computes_cape_energy_progression_table():
         "ip_progression_type": "cape",
         "combat_spec_achievement": "COMBAT_CAPES",
         "enchantment_ips": {1: 800, 2: 900, 3: 1000, 4: 1100},
+        "enchantment_ips_with_base": {0: 700, 1: 800, 2: 900, 3: 1000, 4: 1100},
         "attack_damage": 0,
         "attack_speed": 0,
         "attack_range": 0,
@@ -359,3 +364,108 @@ def test_market_data_history_live_source_uses_market_service():
     assert data["isError"] is False
     assert "structuredContent" in data
     assert data["structuredContent"]["source"]["requested"] == "live"
+
+
+def test_market_data_snapshot_can_skip_summary():
+    with (
+        patch("app.mcp.tools.market.resolve_item_smart", return_value=("T4_BAG", None)),
+        patch("app.mcp.tools.market.market_app") as mock_market,
+    ):
+        mock_market.get_market_prices = AsyncMock(
+            return_value={
+                "data": [
+                    {"location": "Martlock", "sell_price_min": 1200, "buy_price_max": 900},
+                    {"location": "Thetford", "sell_price_min": 1300, "buy_price_max": 1000},
+                ],
+                "locations": ["Martlock", "Thetford"],
+            }
+        )
+
+        response = client.post(
+            "/mcp/tools/call",
+            json={
+                "name": "market_data",
+                "arguments": {"item": "T4_BAG", "summary": False},
+            },
+        )
+
+    assert response.status_code == 200
+    payload = response.json()["structuredContent"]
+    assert payload["summary"] == {"records": 2}
+    assert payload["record_count"] == 2
+
+
+def test_market_data_history_auto_prefers_local_without_live_call():
+    with (
+        patch("app.mcp.tools.market.resolve_item_smart", return_value=("T4_BAG", None)),
+        patch("app.mcp.tools.market.market_app") as mock_market,
+        patch("app.mcp.tools.market.history_db") as mock_history_db,
+    ):
+        mock_history_db.has_records.return_value = True
+        mock_market.get_local_history.return_value = [
+            {"period": "2026-01-01", "location": "Martlock", "avg_sell_min": 1200},
+        ]
+        mock_market.get_live_history = AsyncMock()
+
+        response = client.post(
+            "/mcp/tools/call",
+            json={
+                "name": "market_data",
+                "arguments": {"item": "T4_BAG", "mode": "history", "source": "auto"},
+            },
+        )
+
+    assert response.status_code == 200
+    payload = response.json()["structuredContent"]
+    assert payload["source"]["resolved"] == "local_duckdb"
+    mock_history_db.get_status.assert_not_called()
+    mock_market.get_live_history.assert_not_called()
+
+
+def test_market_data_history_auto_falls_back_to_live():
+    with (
+        patch("app.mcp.tools.market.resolve_item_smart", return_value=("T4_BAG", None)),
+        patch("app.mcp.tools.market.market_app") as mock_market,
+        patch("app.mcp.tools.market.history_db") as mock_history_db,
+    ):
+        mock_history_db.has_records.return_value = True
+        mock_market.get_local_history.return_value = []
+        mock_market.get_live_history = AsyncMock(
+            return_value={"locations": ["Caerleon"], "data": [], "region": "west"}
+        )
+
+        response = client.post(
+            "/mcp/tools/call",
+            json={
+                "name": "market_data",
+                "arguments": {"item": "T4_BAG", "mode": "history", "source": "auto"},
+            },
+        )
+
+    assert response.status_code == 200
+    payload = response.json()["structuredContent"]
+    assert payload["source"]["resolved"] == "live_aodp_history"
+    mock_market.get_live_history.assert_awaited_once()
+
+
+def test_spell_info_does_not_share_cached_nested_data():
+    chain = {
+        "spell_id": "FIREBALL",
+        "display_name": "Fireball",
+        "damage": [{"target": "enemy", "base_damage": 100}],
+    }
+    with patch("app.mcp.tools.combat.spell_db.resolve_spell_chain", return_value=chain):
+        first = asyncio.run(spell_info({"spell": "FIREBALL"}))
+        first["damage"].append({"target": "self", "base_damage": 1})
+        first["damage"][0]["base_damage"] = 0
+        second = asyncio.run(spell_info({"spell": "FIREBALL"}))
+
+    assert second["damage"] == [{"target": "enemy", "base_damage": 100}]
+
+
+def test_spell_info_sees_patch_after_cache_clear():
+    with patch("app.mcp.tools.combat.spell_db.resolve_spell_chain", return_value={"spell_id": "A"}):
+        assert asyncio.run(spell_info({"spell": "Q"}))["spell_id"] == "A"
+    clear_caches()
+    with patch("app.mcp.tools.combat.spell_db.resolve_spell_chain", return_value={"spell_id": "B"}):
+        assert asyncio.run(spell_info({"spell": "Q"}))["spell_id"] == "B"